@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Driver benchmark — login, feed and extraction against local fixture sites.
+
+Each driver is pointed (via base_url) at a fixtures.FixtureServer on
+127.0.0.1 that mimics its platform's DOM, with a throwaway cookie jar
+seeded with its SESSION_COOKIES. Nothing touches the live sites. For
+every operation it reports the median wall time, the number of WebDriver
+round-trips, and at the end the RSS of Chrome's process tree (Linux).
+
+Save a run with --save and compare a later one against it with --baseline
+to catch regressions from wait or selector changes.
+
+Usage:
+    python benchmarks/bench_drivers.py [--runs N] [--platforms a,b] [--items N]
+        [--limit N] [--delay MS] [--launch-profile NAME] [--save FILE] [--baseline FILE]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fixtures import FixtureServer, SITES  # noqa: E402
+from social_cookie_jar import DRIVERS  # noqa: E402
+from social_cookie_jar.launch import LAUNCH_PROFILES  # noqa: E402
+
+
+def feed_op(driver, limit: int):
+    """The platform's read operation: feed(), read_channel() or check_package()."""
+    if driver.PLATFORM == "discord":
+        return driver.read_channel("1", "2", limit=limit)
+    if driver.PLATFORM == "pypi":
+        return driver.check_package("social-cookie-jar")
+    return driver.feed(limit=limit)
+
+
+def count_round_trips(driver) -> dict:
+    """Count WebDriver commands by patching the session's execute()."""
+    counter = {"n": 0}
+    execute = driver.driver.execute
+
+    def counting(command, params=None):
+        counter["n"] += 1
+        return execute(command, params)
+
+    driver.driver.execute = counting
+    return counter
+
+
+def bench_platform(platform: str, args) -> dict:
+    cls = DRIVERS[platform]
+    with FixtureServer(platform, items=args.items, delay=args.delay / 1000) as site, \
+            tempfile.TemporaryDirectory() as cookie_dir:
+        driver = cls(
+            cookie_dir=cookie_dir,
+            base_url=site.url,
+            headless=not args.headed,
+            launch_profile=args.launch_profile,
+        )
+        driver.jar.save(
+            [{"name": n, "value": "fixture", "path": "/"} for n in cls.SESSION_COOKIES],
+            platform,
+        )
+        results = {}
+        try:
+            start = time.perf_counter()
+            driver.driver  # launches Chrome
+            results["launch"] = {"median": time.perf_counter() - start, "round_trips": 0}
+            counter = count_round_trips(driver)
+
+            ops = {
+                "login": driver.login,
+                "feed": lambda: feed_op(driver, args.limit),
+            }
+            if cls.FEED_SELECTOR:
+                ops["extract"] = lambda: driver.extract(cls.FEED_SELECTOR, limit=args.items)
+
+            for name, op in ops.items():
+                times, trips, ok = [], 0, True
+                for _ in range(args.runs):
+                    counter["n"] = 0
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        ok = bool(op())
+                    times.append(time.perf_counter() - start)
+                    trips = counter["n"]
+                results[name] = {
+                    "median": statistics.median(times),
+                    "min": min(times),
+                    "round_trips": trips,
+                    "ok": ok,
+                }
+            results["rss"] = driver.browser_rss()
+            results["renderers"] = driver.browser_renderers()
+        finally:
+            driver.quit()
+        return results
+
+
+def print_results(all_results: dict, baseline: dict):
+    print(f"{'platform':<12} {'op':<8} {'median':>9} {'min':>9} {'trips':>6}  {'vs base':>8}")
+    for platform, results in all_results.items():
+        for op, r in results.items():
+            if op in ("rss", "renderers"):
+                continue
+            delta = ""
+            base = baseline.get(platform, {}).get(op)
+            if base and base["median"]:
+                delta = f"{(r['median'] / base['median'] - 1) * 100:+.0f}%"
+            flag = "" if r.get("ok", True) else "  FAILED"
+            print(
+                f"{platform:<12} {op:<8} {r['median'] * 1000:>7.0f}ms "
+                f"{r.get('min', r['median']) * 1000:>7.0f}ms {r['round_trips']:>6}  {delta:>8}{flag}"
+            )
+        print(
+            f"{platform:<12} {'rss':<8} {results['rss'] / 2**20:>7.0f}MB "
+            f"{results['renderers']:>6} renderers"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--platforms", default=",".join(SITES))
+    parser.add_argument("--items", type=int, default=40, help="feed items per fixture page")
+    parser.add_argument("--limit", type=int, default=20, help="feed() limit")
+    parser.add_argument("--delay", type=float, default=0, help="per-response delay in ms")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--launch-profile", default="default", choices=sorted(LAUNCH_PROFILES))
+    parser.add_argument("--save", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against a saved JSON run")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    all_results = {}
+    for platform in args.platforms.split(","):
+        all_results[platform] = bench_platform(platform, args)
+
+    print_results(all_results, baseline)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(all_results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark — import time for each entry point.
+
+Each case runs in a fresh interpreter so nothing is cached between runs.
+Reports the median wall time and whether Selenium ended up imported.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Probe appended to each case: report whether Selenium was loaded.
+PROBE = "import sys; print('selenium' in sys.modules, file=sys.stderr)"
+
+CASES = {
+    "baseline (python -c pass)": "pass",
+    "import social_cookie_jar": "import social_cookie_jar",
+    "cli: usage": (
+        "import sys, runpy; sys.argv = ['social_cookie_jar']\n"
+        "try: runpy.run_module('social_cookie_jar', run_name='__main__')\n"
+        "except SystemExit: pass"
+    ),
+    "cli: export-cookies": (
+        "import sys, runpy; sys.argv = ['social_cookie_jar', 'export-cookies', 'facebook']\n"
+        "try: runpy.run_module('social_cookie_jar', run_name='__main__')\n"
+        "except SystemExit: pass"
+    ),
+    "first driver access": "from social_cookie_jar import TwitterDriver",
+}
+
+
+def run_case(code: str) -> tuple[float, bool]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", f"{code}\n{PROBE}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+    loaded = proc.stderr.strip().splitlines()[-1:] == ["True"]
+    return elapsed, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'entry point':<30} {'median':>9} {'min':>9}  selenium")
+    for name, code in CASES.items():
+        times = []
+        loaded = False
+        for _ in range(args.runs):
+            elapsed, loaded = run_case(code)
+            times.append(elapsed)
+        print(
+            f"{name:<30} {statistics.median(times) * 1000:>7.1f}ms "
+            f"{min(times) * 1000:>7.1f}ms  {'yes' if loaded else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Local fixture sites for the driver benchmarks.
+
+Each platform gets synthetic HTML shaped like its real DOM — the same
+selectors, attributes and URL layout the drivers rely on — served from a
+threaded http.server on 127.0.0.1. Infinite feeds render one batch of
+items and append the next batch from a <template> when scrolled to the
+bottom, after a short delay, like an XHR-backed feed.
+"""
+
+import html
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+BATCH = 10
+HN_PAGE = 30
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua."
+)
+
+# Appends the next BATCH items from <template id="more"> on reaching the bottom
+_SCROLL_LOADER = """
+<script>
+(() => {
+  const more = document.getElementById("more");
+  const feed = document.getElementById("feed");
+  let loading = false;
+  window.addEventListener("scroll", () => {
+    if (loading || !more.content.children.length) return;
+    if (window.innerHeight + window.scrollY < document.body.scrollHeight - 50) return;
+    loading = true;
+    setTimeout(() => {
+      for (let i = 0; i < %d && more.content.children.length; i++) {
+        feed.appendChild(more.content.firstElementChild);
+      }
+      loading = false;
+    }, 50);
+  });
+})();
+</script>
+""" % BATCH
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+        "<style>body{font:14px sans-serif} #feed>*{display:block;min-height:120px}</style>"
+        f"</head><body>{body}</body></html>"
+    )
+
+
+def _infinite(title: str, wrapper: str, items: list[str]) -> str:
+    """Feed page showing the first BATCH items, with the rest loaded on scroll."""
+    open_tag, close_tag = wrapper.split("{}")
+    return _page(
+        title,
+        f"{open_tag}<div id='feed'>{''.join(items[:BATCH])}</div>{close_tag}"
+        f"<template id='more'>{''.join(items[BATCH:])}</template>{_SCROLL_LOADER}",
+    )
+
+
+def _text(i: int) -> str:
+    return f"Item {i}: {LOREM}"
+
+
+# ── Platforms ──
+# Each site maps a path regex to a function (match, query, items) -> html.
+
+def _facebook_feed(m, q, n):
+    posts = [
+        f"<div role='article'><h3>Author {i}</h3>"
+        f"<a href='/groups/1/posts/{i}/'>2h</a><p>{_text(i)}</p>"
+        f"<div role='textbox' contenteditable='true' aria-label='Write a comment…'></div></div>"
+        for i in range(n)
+    ]
+    return _infinite("Facebook", "<div role='banner'></div><div role='main'>{}</div>", posts)
+
+
+def _twitter_home(m, q, n):
+    tweets = [
+        f"<article data-testid='tweet'><div data-testid='User-Name'>"
+        f"<a role='link' href='/user{i}'>User {i}</a></div>"
+        f"<a href='/user{i}/status/{1000 + i}'><time>1h</time></a><div>{_text(i)}</div></article>"
+        for i in range(n)
+    ]
+    return _infinite("Home / X", "<main><div data-testid='primaryColumn'>{}</div></main>", tweets)
+
+
+def _linkedin_feed(m, q, n):
+    posts = [
+        f"<div class='feed-shared-update-v2' data-urn='urn:li:activity:{7000 + i}'>"
+        f"<span class='update-components-actor__title'><span aria-hidden='true'>Member {i}</span></span>"
+        f"<a href='/feed/update/urn:li:activity:{7000 + i}/'>1d</a><p>{_text(i)}</p></div>"
+        for i in range(n)
+    ]
+    return _infinite("Feed | LinkedIn", "<div class='scaffold-layout'><main>{}</main></div>", posts)
+
+
+def _reddit_feed(m, q, n):
+    sub = m.group(1) or "popular"
+    posts = [
+        f"<shreddit-post post-title='Post {i} in r/{sub}' "
+        f"permalink='/r/{sub}/comments/{i}/post_{i}/' subreddit-prefixed-name='r/{sub}'>"
+        f"{_text(i)}</shreddit-post>"
+        for i in range(n)
+    ]
+    return _infinite("Reddit", "<header></header><shreddit-app>{}</shreddit-app>", posts)
+
+
+def _discord_home(m, q, n):
+    return _page("Discord", "<nav aria-label='Servers'></nav>")
+
+
+def _discord_channel(m, q, n):
+    channel = m.group(2)
+    messages = "".join(
+        f"<li id='chat-messages-{channel}-{10**17 + i}'>"
+        f"<span id='message-username-{10**17 + i}'>user{i % 7}</span><div>{_text(i)}</div></li>"
+        for i in range(n)
+    )
+    return _page(
+        "Discord",
+        f"<nav aria-label='Servers'></nav><ol>{messages}</ol>"
+        "<div role='textbox' contenteditable='true'></div>",
+    )
+
+
+def _instagram_home(m, q, n):
+    posts = [
+        f"<article><header><a href='/user{i}/'><span>user{i}</span></a></header>"
+        f"<a href='/p/C{i:08d}/'>photo</a><div>{_text(i)}</div></article>"
+        for i in range(n)
+    ]
+    return _infinite("Instagram", "<main role='main'>{}</main>", posts)
+
+
+def _hackernews_list(m, q, n):
+    page = m.group(1) or "news"
+    p = int(q.get("p", ["1"])[0])
+    start = (p - 1) * HN_PAGE
+    rows = "".join(
+        f"<tr class='athing' id='{40000000 + i}'><td class='title'>"
+        f"<span class='titleline'><a href='https://example.com/story/{i}'>Story {i}</a></span>"
+        f"</td></tr><tr><td class='subtext'>{i} points</td></tr>"
+        for i in range(start, min(start + HN_PAGE, n))
+    )
+    more = f"<a class='morelink' href='{page}?p={p + 1}'>More</a>" if start + HN_PAGE < n else ""
+    return _page(
+        "Hacker News",
+        f"<table id='hnmain'><tr><td>user | <a href='logout'>logout</a></td></tr>"
+        f"{rows}</table>{more}",
+    )
+
+
+def _substack_home(m, q, n):
+    return _page("Substack", "<main id='main'>Dashboard</main>")
+
+
+def _substack_inbox(m, q, n):
+    posts = [
+        f"<div class='post-preview'><a href='https://writer{i}.substack.com/p/post-{i}'>"
+        f"Post {i}</a><p>{_text(i)}</p></div>"
+        for i in range(n)
+    ]
+    return _infinite("Inbox", "<main id='main'>{}</main>", posts)
+
+
+def _pypi_projects(m, q, n):
+    return _page("Your projects · PyPI", "<main><h1>Your projects</h1></main>")
+
+
+def _pypi_project(m, q, n):
+    name = html.escape(m.group(1))
+    return _page(
+        f"{name} · PyPI",
+        f"<main><h1 class='package-header__name'>{name} 1.0.0</h1>"
+        f"<p class='release__version'>1.0.0</p><p>{LOREM}</p></main>",
+    )
+
+
+SITES = {
+    "facebook": [(r"/(?:me|groups/[^/]+/)?", _facebook_feed)],
+    "twitter": [(r"/home", _twitter_home)],
+    "linkedin": [(r"/feed/", _linkedin_feed)],
+    "reddit": [(r"/(?:r/([^/]+)/)?", _reddit_feed)],
+    "discord": [(r"/channels/@me", _discord_home), (r"/channels/([^/]+)/([^/]+)", _discord_channel)],
+    "instagram": [(r"/", _instagram_home)],
+    "hackernews": [(r"/(news|newest|ask|show)?", _hackernews_list)],
+    "substack": [(r"/", _substack_home), (r"/inbox", _substack_inbox)],
+    "pypi": [(r"/manage/projects/", _pypi_projects), (r"/project/([^/]+)/", _pypi_project)],
+}
+
+
+class FixtureServer:
+    """Serve one platform's fixture site on an ephemeral 127.0.0.1 port.
+
+    `items` is the number of feed items each feed page offers and `delay`
+    (seconds) is added to every response to stand in for network latency.
+    """
+
+    def __init__(self, platform: str, items: int = 40, delay: float = 0.0):
+        routes = [(re.compile(pattern + r"$"), render) for pattern, render in SITES[platform]]
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                for pattern, render in routes:
+                    m = pattern.match(url.path)
+                    if m:
+                        status, body = 200, render(m, parse_qs(url.query), items)
+                        break
+                else:
+                    status, body = 404, _page("Not found", "<h1>Page not found</h1>")
+                if delay:
+                    time.sleep(delay)
+                data = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.platform = platform
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
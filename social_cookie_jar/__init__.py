@@ -2,23 +2,45 @@
 
 __version__ = "0.2.0"
 
+import importlib
+
 from .cookie_jar import CookieJar
-from .export import export_from_cdp, export_from_json
-
-from .drivers.facebook import FacebookDriver
-from .drivers.twitter import TwitterDriver
-from .drivers.linkedin import LinkedInDriver
-from .drivers.reddit import RedditDriver
-from .drivers.discord import DiscordDriver
-from .drivers.instagram import InstagramDriver
-from .drivers.hackernews import HackerNewsDriver
-from .drivers.substack import SubstackDriver
-from .drivers.pypi import PyPIDriver
+from .export import export_all_from_cdp, export_from_cdp, export_from_json
+from .multi_feed import iter_feeds
+from .registry import DRIVERS
+
+# Driver classes import Selenium, so they are resolved on first access.
+_LAZY_DRIVERS = DRIVERS.class_names()
+_LAZY_OTHER = {
+    "AsyncDriver": ".async_driver",
+    "SharedBrowser": ".drivers.shared",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_DRIVERS:
+        cls = DRIVERS[_LAZY_DRIVERS[name]]
+        globals()[name] = cls
+        return cls
+    # asyncio and Selenium are a noticeable share of import time; load on demand
+    if name in _LAZY_OTHER:
+        value = getattr(importlib.import_module(_LAZY_OTHER[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_DRIVERS) | set(_LAZY_OTHER))
 
 __all__ = [
+    "AsyncDriver",
     "CookieJar",
     "export_from_cdp",
+    "export_all_from_cdp",
     "export_from_json",
+    "iter_feeds",
+    "SharedBrowser",
     # Platform drivers
     "FacebookDriver",
     "TwitterDriver",
@@ -18,44 +18,156 @@ Actions by platform:
     substack:    login, feed, comment <url> "text"
     pypi:        login, check <package_name>
 
+    check <platform>    Offline session check from saved cookies (no browser)
+    feed all|<p1,p2,...> [--timeout SECONDS] [--shared-browser]
+                        Read several feeds concurrently, one line per item tagged [platform];
+                        "all" means every feed platform with saved cookies (default timeout 60s).
+                        --shared-browser runs them as tabs of one Chrome (less memory,
+                        but the tabs load one page at a time)
+    stats [--prometheus] [--cookie-dir DIR]
+                        Action counts, success rates and p50/p95/p99 latency
+    profiles [list|clean] [platforms...] [--max-mb N] [--profile-dir DIR]
+                        Chrome profile sizes; clean drops caches down to N MB (default 0)
+    serve [--idle-timeout SECONDS] [--socket PATH]
+          [--max-heap-mb N] [--max-rss-mb N] [--ping-timeout SECONDS]
+                        Keep logged-in drivers warm; other commands run in it while it is up
+                        (default idle timeout 600s, socket $SOCIAL_COOKIE_JAR_SOCKET or /tmp).
+                        The limits recycle a driver's tab (JS heap) or Chrome (RSS, hung page)
+
+    --cache-ttl SECONDS  Serve feed results younger than this from ./cookies/state/feed_cache
+    --login-ttl SECONDS  Trust a login verified less than this long ago (just inject cookies)
+    --no-lite            Load images, media and fonts on reads too (blocked by default)
+    --launch-profile NAME
+                         Chrome flag set: default, or low-memory for tight containers
+    --new                feed/read: only items not returned by an earlier --new run
+    --profile-dir DIR    Keep a Chrome profile per platform in DIR (warm cache, saved session)
+    --trace FILE         Write a Chrome trace-event JSON of the run (or set SOCIAL_COOKIE_JAR_TRACE)
+    --no-daemon          Run in this process even if `serve` is running
     export-cookies <platform> --cdp-url URL | --json-file FILE [--cookie-dir DIR]
+    export-cookies all|<p1,p2,...> --cdp-url URL | --json-file FILE [--cookie-dir DIR]
 
 Examples:
     python -m social_cookie_jar login twitter
+    python -m social_cookie_jar check twitter
     python -m social_cookie_jar post twitter "Hello from an AI agent 🤖"
     python -m social_cookie_jar feed reddit LocalLLaMA
+    python -m social_cookie_jar feed hackernews --cache-ttl 60
+    python -m social_cookie_jar feed twitter --login-ttl 3600
+    python -m social_cookie_jar feed reddit LocalLLaMA --new
+    python -m social_cookie_jar feed twitter,reddit,hackernews --timeout 30
+    python -m social_cookie_jar serve --idle-timeout 300 &
     python -m social_cookie_jar export-cookies facebook --cdp-url http://127.0.0.1:9222
+    python -m social_cookie_jar export-cookies all --cdp-url http://127.0.0.1:9222
 """
 
 import sys
 import argparse
+from pathlib import Path
+
+from .export import (
+    export_all_from_cdp,
+    export_from_cdp,
+    export_from_json,
+    iter_json_cookies,
+    normalize_cookies,
+    write_cookies,
+)
+from . import tracing
+from .cookie_jar import CookieJar
+from .daemon import forward
+from .metrics import Metrics
+from .multi_feed import feed_platforms, iter_feeds
+from .profiles import list_profiles, profile_path, trim_profile
+from .registry import DRIVERS
+
+
+def _pop_option(name: str, default=None):
+    """Remove `name VALUE` from sys.argv and return VALUE."""
+    if name not in sys.argv:
+        return default
+    i = sys.argv.index(name)
+    if i + 1 >= len(sys.argv):
+        print(f"{name} needs a value")
+        print(__doc__)
+        sys.exit(1)
+    value = sys.argv[i + 1]
+    del sys.argv[i:i + 2]
+    return value
+
+
+def _pop_flag(name: str) -> bool:
+    """Remove `name` from sys.argv and return whether it was there."""
+    if name not in sys.argv:
+        return False
+    sys.argv.remove(name)
+    return True
+
+
+def main(pool=None):
+    """Run the CLI on sys.argv; `pool` is the daemon's DriverPool when serving."""
+    argv = sys.argv[1:]
+    no_daemon = _pop_flag("--no-daemon")
+    feed_cache_ttl = float(_pop_option("--cache-ttl", 0))
+    login_cache_ttl = float(_pop_option("--login-ttl", 0))
+    trace_file = _pop_option("--trace")
+    feed_timeout = float(_pop_option("--timeout", 60))
+    profile_dir = _pop_option("--profile-dir")
+    launch_profile = _pop_option("--launch-profile", "default")
+    if trace_file:
+        tracing.enable(trace_file)
+    only_new = _pop_flag("--new")
+    shared_browser = _pop_flag("--shared-browser")
+    lite = False if _pop_flag("--no-lite") else None
+
+    # Chrome profile sizes and cleanup (no driver needed)
+    if sys.argv[1:2] == ["profiles"]:
+        parser = argparse.ArgumentParser(prog="social_cookie_jar profiles")
+        parser.add_argument("action")
+        parser.add_argument("command", nargs="?", choices=["list", "clean"], default="list")
+        parser.add_argument("platforms", nargs="*")
+        parser.add_argument("--max-mb", type=float, default=0)
+        args = parser.parse_args()
+        root = profile_dir or "./profiles"
+        for name, size in list_profiles(root).items():
+            if args.platforms and name not in args.platforms:
+                continue
+            if args.command == "clean":
+                freed = trim_profile(profile_path(root, name), int(args.max_mb * 2**20))
+                print(f"[{name}] freed {freed / 2**20:.1f} MB")
+            else:
+                print(f"[{name}] {size / 2**20:.1f} MB")
+        return
+
+    # Metrics report (no driver needed)
+    if sys.argv[1:2] == ["stats"]:
+        parser = argparse.ArgumentParser(prog="social_cookie_jar stats")
+        parser.add_argument("action")
+        parser.add_argument("--cookie-dir", default="./cookies")
+        parser.add_argument("--prometheus", action="store_true")
+        args = parser.parse_args()
+        totals = Metrics.load(Path(args.cookie_dir) / "state" / "metrics.json")
+        sys.stdout.write(totals.prometheus() if args.prometheus else totals.summary() + "\n")
+        return
+
+    # Warm-driver daemon
+    if sys.argv[1:2] == ["serve"] and pool is None:
+        parser = argparse.ArgumentParser(prog="social_cookie_jar serve")
+        parser.add_argument("action")
+        parser.add_argument("--idle-timeout", type=float, default=600)
+        parser.add_argument("--socket", default=None)
+        parser.add_argument("--max-heap-mb", type=float, default=0)
+        parser.add_argument("--max-rss-mb", type=float, default=0)
+        parser.add_argument("--ping-timeout", type=float, default=0)
+        args = parser.parse_args()
+        from .daemon import serve
+        limits = {
+            "max_heap_mb": args.max_heap_mb,
+            "max_rss_mb": args.max_rss_mb,
+            "ping_timeout": args.ping_timeout,
+        }
+        serve(args.socket, args.idle_timeout, **{k: v for k, v in limits.items() if v})
+        return
 
-from .drivers.facebook import FacebookDriver
-from .drivers.twitter import TwitterDriver
-from .drivers.linkedin import LinkedInDriver
-from .drivers.reddit import RedditDriver
-from .drivers.discord import DiscordDriver
-from .drivers.instagram import InstagramDriver
-from .drivers.hackernews import HackerNewsDriver
-from .drivers.substack import SubstackDriver
-from .drivers.pypi import PyPIDriver
-from .export import export_from_cdp, export_from_json
-
-
-DRIVERS = {
-    "facebook": FacebookDriver,
-    "twitter": TwitterDriver,
-    "linkedin": LinkedInDriver,
-    "reddit": RedditDriver,
-    "discord": DiscordDriver,
-    "instagram": InstagramDriver,
-    "hackernews": HackerNewsDriver,
-    "substack": SubstackDriver,
-    "pypi": PyPIDriver,
-}
-
-
-def main():
     if len(sys.argv) < 3:
         print(__doc__)
         sys.exit(1)
@@ -72,7 +184,20 @@ def main():
         parser.add_argument("--json-file", default=None)
         parser.add_argument("--cookie-dir", default="./cookies")
         args = parser.parse_args()
-        if args.cdp_url:
+        batch = args.platform == "all" or "," in args.platform
+        if batch and (args.cdp_url or args.json_file):
+            platforms = None if args.platform == "all" else args.platform.split(",")
+            if args.cdp_url:
+                paths = export_all_from_cdp(args.cdp_url, args.cookie_dir, platforms)
+            else:
+                jars = normalize_cookies(iter_json_cookies(args.json_file), platforms)
+                paths = write_cookies(jars, args.cookie_dir)
+            for name, path in sorted(paths.items()):
+                print(f"Exported {name} cookies to {path}")
+            if not paths:
+                print("No cookies found for any platform")
+                sys.exit(1)
+        elif args.cdp_url:
             path = export_from_cdp(args.cdp_url, args.platform, args.cookie_dir)
             print(f"Exported cookies to {path}")
         elif args.json_file:
@@ -83,19 +208,72 @@ def main():
             sys.exit(1)
         return
 
+    # Several feeds at once: feed all | feed <p1,p2,...>
+    if action == "feed" and (platform == "all" or "," in platform):
+        if platform == "all":
+            # Every feed platform with saved cookies
+            saved = set(CookieJar().platforms())
+            platforms = [p for p in feed_platforms() if p in saved]
+        else:
+            platforms = platform.split(",")
+            unknown = [p for p in platforms if p not in feed_platforms()]
+            if unknown:
+                print(f"No feed for: {', '.join(unknown)}")
+                print(f"Supported: {', '.join(feed_platforms())}")
+                sys.exit(1)
+        kwargs = {
+            "feed_cache_ttl": feed_cache_ttl,
+            "login_cache_ttl": login_cache_ttl,
+            "profile_dir": profile_dir,
+            "lite": lite,
+            "launch_profile": launch_profile,
+        }
+        if shared_browser:
+            from .drivers.shared import SharedBrowser
+            kwargs["browser"] = SharedBrowser()
+        items = iter_feeds(platforms, timeout=feed_timeout, only_new=only_new, **kwargs)
+        for p, item in items:
+            print(f"[{p}] {(getattr(item, 'title', '') or item.text)[:200]}")
+        return
+
     if platform not in DRIVERS:
         print(f"Unknown platform: {platform}")
         print(f"Supported: {', '.join(DRIVERS.keys())}")
         sys.exit(1)
 
-    driver = DRIVERS[platform]()
+    # Run in the daemon if one is up (traces stay with the process that asked)
+    if pool is None and not no_daemon and not trace_file:
+        reply = forward(argv)
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.exit(reply["exit"])
+
+    kwargs = {
+        "feed_cache_ttl": feed_cache_ttl,
+        "login_cache_ttl": login_cache_ttl,
+        "profile_dir": profile_dir,
+        "lite": lite,
+        "launch_profile": launch_profile,
+    }
+    driver = pool.get(platform, **kwargs) if pool is not None else DRIVERS[platform](**kwargs)
+
+    # Offline session check (no browser); `check pypi <package>` is a PyPI lookup
+    if action == "check" and not (platform == "pypi" and len(sys.argv) > 3):
+        result = driver.preflight()
+        print(f"[{platform}] {result.status}: {result.describe()}")
+        sys.exit(0 if result else 1)
+
     try:
         # Login check for all platforms
         if action == "login-creds" and platform == "hackernews":
             driver.login_with_creds(sys.argv[3], sys.argv[4])
             return
 
-        if not driver.login():
+        if action == "feed" and driver.has_fresh_feed(*sys.argv[3:4]):
+            pass  # Answered from the feed cache; no browser needed
+        elif pool is not None and driver.logged_in:
+            pass  # Warm session in the daemon
+        elif not driver.login():
             print(f"[{platform}] Not logged in. Export cookies first:")
             print(f"  python -m social_cookie_jar export-cookies {platform} --cdp-url http://127.0.0.1:9222")
             sys.exit(1)
@@ -107,13 +285,15 @@ def main():
         elif platform == "facebook":
             if action == "feed":
                 group_id = sys.argv[3] if len(sys.argv) > 3 else None
-                for p in driver.feed(group_id):
+                for p in driver.iter_feed(group_id, only_new=only_new):
                     print(f"\n{'='*60}\nPost {p.index}: {p.text[:200]}")
             elif action == "post":
                 driver.post(sys.argv[3])
             elif action == "comment":
                 driver.comment(sys.argv[3], sys.argv[4])
             elif action == "group-comment":
+                # comment_in_feed() needs the group page loaded, not a cached feed
+                driver.feed_cache = None
                 driver.feed(sys.argv[3])
                 driver.comment_in_feed(int(sys.argv[4]), sys.argv[5])
             else:
@@ -122,7 +302,7 @@ def main():
         # ── Twitter ──
         elif platform == "twitter":
             if action == "feed":
-                for t in driver.feed():
+                for t in driver.iter_feed(only_new=only_new):
                     print(f"\n{'='*60}\nTweet {t.index}: {t.text[:200]}")
             elif action == "post":
                 driver.post(sys.argv[3])
@@ -139,7 +319,7 @@ def main():
         # ── LinkedIn ──
         elif platform == "linkedin":
             if action == "feed":
-                for p in driver.feed():
+                for p in driver.iter_feed(only_new=only_new):
                     print(f"\n{'='*60}\nPost {p.index}: {p.text[:200]}")
             elif action == "post":
                 driver.post(sys.argv[3])
@@ -152,7 +332,7 @@ def main():
         elif platform == "reddit":
             if action == "feed":
                 sub = sys.argv[3] if len(sys.argv) > 3 else None
-                for p in driver.feed(sub):
+                for p in driver.iter_feed(sub, only_new=only_new):
                     print(f"\n{'='*60}\n{p.title[:200]}")
             elif action == "post":
                 body = sys.argv[5] if len(sys.argv) > 5 else ""
@@ -165,7 +345,7 @@ def main():
         # ── Discord ──
         elif platform == "discord":
             if action == "read":
-                for m in driver.read_channel(sys.argv[3], sys.argv[4]):
+                for m in driver.read_channel(sys.argv[3], sys.argv[4], only_new=only_new):
                     print(f"\n{m.text[:200]}")
             elif action == "send":
                 driver.send_message(sys.argv[3], sys.argv[4], sys.argv[5])
@@ -175,7 +355,7 @@ def main():
         # ── Instagram ──
         elif platform == "instagram":
             if action == "feed":
-                for p in driver.feed():
+                for p in driver.iter_feed(only_new=only_new):
                     print(f"\n{'='*60}\n{p.text[:200]}")
             elif action == "comment":
                 driver.comment(sys.argv[3], sys.argv[4])
@@ -188,7 +368,7 @@ def main():
         elif platform == "hackernews":
             if action == "feed":
                 page = sys.argv[3] if len(sys.argv) > 3 else "news"
-                for p in driver.feed(page):
+                for p in driver.iter_feed(page, only_new=only_new):
                     print(f"  {p.index}. {p.title[:100]}")
             elif action == "submit":
                 # submit hackernews "title" [--url URL | --text TEXT]
@@ -207,7 +387,7 @@ def main():
         # ── Substack ──
         elif platform == "substack":
             if action == "feed":
-                for p in driver.feed():
+                for p in driver.iter_feed(only_new=only_new):
                     print(f"\n{'='*60}\n{p.title[:200]}")
             elif action == "comment":
                 driver.comment(sys.argv[3], sys.argv[4])
@@ -225,8 +405,13 @@ def main():
             else:
                 print(f"Unknown action for pypi: {action}")
 
+    except Exception:
+        if pool is not None:
+            pool.discard(driver)  # The browser may be broken; start afresh next time
+        raise
     finally:
-        driver.quit()
+        if pool is None:
+            driver.quit()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""Asyncio wrapper that keeps driver calls off the event loop.
+
+Selenium is blocking and not thread-safe, so each AsyncDriver owns one
+worker thread and runs every call of its driver there, one at a time.
+The event loop only awaits the results, which lets a single loop drive
+several platforms at once:
+
+    async with AsyncDriver(TwitterDriver()) as tw, AsyncDriver(RedditDriver()) as rd:
+        await asyncio.gather(tw.login(), rd.login())
+        tweets, posts = await asyncio.gather(tw.feed(), rd.feed("LocalLLaMA"))
+        async for tweet in tw.iter_feed(limit=50):
+            ...
+
+Driver methods become coroutine functions and generator methods
+(iter_feed) become async iterators, with each item produced on the
+worker thread. Other attributes are read directly. For anything else,
+`await adriver.run(fn, *args)` calls `fn(driver, *args)` on the worker.
+"""
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+_DONE = object()
+
+
+class AsyncDriver:
+    """Run a BaseDriver's methods on its own thread and await them."""
+
+    def __init__(self, driver):
+        self.sync = driver
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"scj-{driver.PLATFORM}"
+        )
+
+    async def _call(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def run(self, fn, *args, **kwargs):
+        """Call `fn(driver, *args, **kwargs)` on the driver's thread."""
+        return await self._call(fn, self.sync, *args, **kwargs)
+
+    async def _iterate(self, method, *args, **kwargs):
+        gen = await self._call(method, *args, **kwargs)
+        try:
+            while True:
+                item = await self._call(next, gen, _DONE)
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            await self._call(gen.close)
+
+    def __getattr__(self, name):
+        if isinstance(inspect.getattr_static(type(self.sync), name, None), property):
+            # e.g. `driver` would start Chrome on the event loop's thread
+            raise AttributeError(
+                f"{name} is a property; use `await adriver.run(lambda d: d.{name})`"
+            )
+        attr = getattr(self.sync, name)
+        if not callable(attr):
+            return attr
+        if inspect.isgeneratorfunction(attr):
+            return functools.wraps(attr)(functools.partial(self._iterate, attr))
+        return functools.wraps(attr)(functools.partial(self._call, attr))
+
+    async def aclose(self):
+        """Quit the browser on the worker thread, then stop the thread."""
+        try:
+            await self._call(self.sync.quit)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
@@ -1,65 +1,316 @@
 """Cookie jar management — load, save, validate cookies."""
 
-import pickle
-import json
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from .storage import STORES
+
+
+_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None"}
+
+
+@dataclass
+class InjectResult:
+    """Outcome of CookieJar.inject. Truthy when at least one cookie was set."""
+    injected: list[str] = field(default_factory=list)
+    rejected: dict[str, str] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.injected)
+
+
+@dataclass
+class CookieDiff:
+    """Cookie changes between the browser and the saved jar, keyed on (name, domain, path)."""
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    written: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+def _cookie_key(cookie: dict) -> tuple:
+    return (cookie.get("name"), cookie.get("domain", ""), cookie.get("path", "/"))
+
+
+@dataclass
+class Preflight:
+    """Offline session check. `status` is one of valid, expiring, expired, missing.
+
+    Truthy when the session is usable (valid or expiring).
+    """
+    platform: str
+    status: str
+    missing: list[str] = field(default_factory=list)
+    expired: list[str] = field(default_factory=list)
+    expires_at: Optional[int] = None
+
+    def __bool__(self) -> bool:
+        return self.status in ("valid", "expiring")
+
+    def describe(self) -> str:
+        if self.status == "missing":
+            if self.missing:
+                return f"missing session cookies: {', '.join(self.missing)}"
+            return "no cookies saved"
+        if self.status == "expired":
+            return f"session cookies expired: {', '.join(self.expired)}"
+        if self.expires_at is None:
+            return "session cookies present (no expiry)"
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.expires_at))
+        return f"session cookies valid until {when}"
+
+
+@dataclass
+class _CacheEntry:
+    """Parsed cookies for one platform, valid while the store's stamp matches."""
+    source: Path
+    stamp: tuple
+    cookies: list[dict]
+    names: frozenset[str]
+
+
+def _reason(exc: Exception) -> str:
+    """First line of an exception message, for rejection reports."""
+    lines = str(exc).strip().splitlines()
+    return lines[0] if lines else type(exc).__name__
+
+
+def to_cdp_cookie(cookie: dict, url: str) -> dict:
+    """Convert a Selenium-format cookie to a CDP Network.CookieParam."""
+    param = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if cookie.get("domain"):
+        param["domain"] = cookie["domain"]
+    else:
+        param["url"] = url
+    if cookie.get("expiry"):
+        param["expires"] = cookie["expiry"]
+    same_site = _SAME_SITE.get(str(cookie.get("sameSite", "")).lower())
+    if same_site:
+        param["sameSite"] = same_site
+    return param
+
 
 class CookieJar:
     """Manages browser cookies for social platforms."""
 
-    def __init__(self, cookie_dir: str = "./cookies"):
+    def __init__(self, cookie_dir: str = "./cookies", store="pickle"):
+        """`store` is a backend name from storage.STORES ("pickle" or "sqlite")
+        or an already constructed store."""
         self.cookie_dir = Path(cookie_dir)
         self.cookie_dir.mkdir(parents=True, exist_ok=True)
+        self.store = STORES[store](self.cookie_dir) if isinstance(store, str) else store
+        self._cache: dict[str, _CacheEntry] = {}
 
     def save(self, cookies: list[dict], platform: str, fmt: str = "pkl") -> Path:
-        """Save cookies to disk."""
-        path = self.cookie_dir / f"{platform}.{fmt}"
-        if fmt == "pkl":
-            with open(path, "wb") as f:
-                pickle.dump(cookies, f)
-        elif fmt == "json":
-            with open(path, "w") as f:
-                json.dump(cookies, f, indent=2)
-        else:
-            raise ValueError(f"Unknown format: {fmt}")
+        """Save cookies. `fmt` picks pkl or json for the pickle store."""
+        path = self.store.write(platform, cookies, fmt)
+        self._remember(platform, path, cookies)
         return path
 
+    def diff(self, cookies: list[dict], platform: str) -> CookieDiff:
+        """Compare `cookies` with what is saved for `platform`."""
+        entry = self._entry(platform)
+        old = {_cookie_key(c): c for c in entry.cookies} if entry else {}
+        new = {_cookie_key(c): c for c in cookies}
+        return CookieDiff(
+            added=sum(1 for k in new if k not in old),
+            updated=sum(1 for k, c in new.items() if k in old and old[k] != c),
+            removed=sum(1 for k in old if k not in new),
+        )
+
+    def save_if_changed(self, cookies: list[dict], platform: str, fmt: str = "pkl") -> CookieDiff:
+        """Save cookies only if they differ from the saved jar."""
+        diff = self.diff(cookies, platform)
+        if diff.changed or self._entry(platform) is None:
+            self.save(cookies, platform, fmt)
+            diff.written = True
+        return diff
+
+    def _remember(
+        self, platform: str, source: Path, cookies: list[dict], stamp=None
+    ) -> _CacheEntry:
+        entry = _CacheEntry(
+            source=source,
+            stamp=stamp or self.store.stamp(source, platform),
+            cookies=[dict(c) for c in cookies],
+            names=frozenset(c["name"] for c in cookies if "name" in c),
+        )
+        self._cache[platform] = entry
+        return entry
+
+    def _entry(self, platform: str) -> Optional[_CacheEntry]:
+        """Return the cache entry for a platform, re-reading only if it changed.
+
+        A cached entry is checked with the store's stamp (one stat of the
+        pickle file, or one indexed row for SQLite); the pkl/json probe only
+        runs on a miss or when that file is gone.
+        """
+        entry = self._cache.get(platform)
+        if entry is not None:
+            stamp = self.store.stamp(entry.source, platform)
+            if stamp is not None and stamp == entry.stamp:
+                return entry
+            del self._cache[platform]
+
+        source = self.store.locate(platform)
+        if source is None:
+            return None
+        # Stamp before reading, so a write in between forces a re-read next time
+        stamp = self.store.stamp(source, platform)
+        return self._remember(platform, source, self.store.read(source, platform), stamp)
+
     def load(self, platform: str) -> Optional[list[dict]]:
-        """Load cookies from disk. Tries pkl first, then json."""
-        for fmt in ("pkl", "json"):
-            path = self.cookie_dir / f"{platform}.{fmt}"
-            if path.exists():
-                if fmt == "pkl":
-                    with open(path, "rb") as f:
-                        return pickle.load(f)
-                else:
-                    with open(path) as f:
-                        return json.load(f)
-        return None
+        """Load cookies; cached until the store reports a change.
+
+        Returns a fresh copy, so callers may modify it.
+        """
+        entry = self._entry(platform)
+        if entry is None:
+            return None
+        return [dict(c) for c in entry.cookies]
+
+    def close(self):
+        """Release the store's open files; it reopens them if used again."""
+        self.store.close()
+
+    def invalidate(self, platform: str | None = None):
+        """Drop cached cookies for one platform, or all of them."""
+        if platform is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(platform, None)
+
+    def platforms(self) -> list[str]:
+        """Platforms with saved cookies."""
+        return self.store.platforms()
+
+    def expiring(
+        self, within: float = 86400, names: Optional[list[str]] = None
+    ) -> dict[str, int]:
+        """Platforms with cookies expiring in the next `within` seconds.
+
+        Maps platform to its earliest expiry (epoch seconds), including
+        cookies that have already expired. Pass `names` to only consider
+        those cookies, e.g. a driver's SESSION_COOKIES.
+        """
+        return self.store.expiring(time.time() + within, names)
 
     def has_session(self, platform: str, required_cookies: list[str]) -> bool:
         """Check if saved cookies contain required session cookies."""
-        cookies = self.load(platform)
-        if not cookies:
+        entry = self._entry(platform)
+        if entry is None or not entry.cookies:
             return False
-        cookie_names = {c["name"] for c in cookies}
-        return all(name in cookie_names for name in required_cookies)
+        return entry.names.issuperset(required_cookies)
+
+    def preflight(
+        self,
+        platform: str,
+        session_cookies: list[str],
+        require_all: bool = True,
+        warn_within: float = 86400,
+    ) -> Preflight:
+        """Classify a saved session from its cookies' `expiry` fields, without a browser.
+
+        With `require_all` every cookie in `session_cookies` must be present
+        and unexpired; otherwise one is enough. Sessions whose earliest
+        relevant expiry falls within `warn_within` seconds are "expiring".
+        """
+        entry = self._entry(platform)
+        if entry is None or not entry.cookies:
+            return Preflight(platform, "missing")
 
-    def inject(self, driver, platform: str, domain: str) -> bool:
-        """Load cookies and inject them into a Selenium driver."""
+        now = time.time()
+        expiry = {}
+        for c in entry.cookies:
+            if c.get("name") in session_cookies:
+                expiry[c["name"]] = c.get("expiry")
+        missing = [n for n in session_cookies if n not in expiry]
+        expired = [n for n, exp in expiry.items() if exp and exp < now]
+        alive = [n for n in expiry if n not in expired]
+
+        if (require_all and missing) or not expiry:
+            return Preflight(platform, "missing", missing=missing)
+        if (require_all and expired) or not alive:
+            return Preflight(platform, "expired", missing=missing, expired=expired)
+
+        # All required: the first to expire ends the session; any: the last one
+        deadlines = [expiry[n] for n in alive if expiry[n]]
+        if not deadlines or (not require_all and len(deadlines) < len(alive)):
+            expires_at = None
+        else:
+            expires_at = int(min(deadlines) if require_all else max(deadlines))
+        status = "expiring" if expires_at and expires_at < now + warn_within else "valid"
+        return Preflight(platform, status, missing, expired, expires_at)
+
+    def inject(self, driver, platform: str, domain: str) -> InjectResult:
+        """Load cookies and inject them into a Selenium driver.
+
+        Chrome drivers get every cookie in one CDP Network.setCookies call
+        with no navigation, so the caller's first page load already carries
+        the session. Other drivers fall back to navigating to `domain` and
+        calling add_cookie per cookie. Cookies that could not be set are
+        listed in the result's `rejected` with the reason.
+        """
+        result = InjectResult()
         cookies = self.load(platform)
         if not cookies:
-            return False
+            return result
+
+        now = time.time()
+        valid = []
+        for cookie in cookies:
+            name = cookie.get("name")
+            if not name or "value" not in cookie:
+                result.rejected[name or "<unnamed>"] = "missing name or value"
+            elif cookie.get("expiry") and cookie["expiry"] < now:
+                result.rejected[name] = "expired"
+            else:
+                valid.append(cookie)
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            self._inject_cdp(driver, valid, domain, result)
+        else:
+            self._inject_webdriver(driver, valid, domain, result)
+        return result
+
+    def _inject_cdp(self, driver, cookies: list[dict], url: str, result: InjectResult):
+        params = [to_cdp_cookie(c, url) for c in cookies]
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+            result.injected.extend(c["name"] for c in cookies)
+            return
+        except Exception:
+            pass
+        # The batch is all-or-nothing; retry one by one to find the culprits
+        for param in params:
+            try:
+                res = driver.execute_cdp_cmd("Network.setCookie", param)
+            except Exception as e:
+                result.rejected[param["name"]] = _reason(e)
+                continue
+            if res.get("success", True):
+                result.injected.append(param["name"])
+            else:
+                result.rejected[param["name"]] = "rejected by browser"
+
+    def _inject_webdriver(self, driver, cookies: list[dict], domain: str, result: InjectResult):
+        # get() returns once the page has loaded; cookies can be set right away
         driver.get(domain)
-        import time
-        time.sleep(1)
-        injected = 0
         for cookie in cookies:
             try:
                 driver.add_cookie(cookie)
-                injected += 1
-            except Exception:
-                pass
-        return injected > 0
+                result.injected.append(cookie["name"])
+            except Exception as e:
+                result.rejected[cookie["name"]] = _reason(e)
@@ -0,0 +1,222 @@
+"""Daemon that keeps logged-in drivers warm behind a Unix socket.
+
+`python -m social_cookie_jar serve` holds one driver per platform (per
+set of driver options), logged in once and reused. The CLI forwards
+driver actions to it when it is running and falls back to running them
+in-process otherwise. A driver idle for `idle_timeout` seconds is shut
+down; between requests the others get a health check (see
+BaseDriver.check_health) when the daemon was started with limits.
+
+Protocol: one JSON object per line each way.
+
+    -> {"argv": ["feed", "hackernews"], "cwd": "/path"}
+    <- {"stdout": "...", "exit": 0}
+
+Requests are served one at a time, so each driver stays on one thread.
+The daemon resolves ./cookies and friends against its own working
+directory, so requests from a different cwd are declined and run locally.
+"""
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Optional
+
+ENV_VAR = "SOCIAL_COOKIE_JAR_SOCKET"
+
+# Seconds to wait for the daemon to accept a request, then to answer it
+CONNECT_TIMEOUT = 2.0
+REPLY_TIMEOUT = 120.0
+
+# Seconds between health checks of one pooled driver
+HEALTH_INTERVAL = 30.0
+
+
+def default_socket_path() -> str:
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.environ.get(ENV_VAR) or os.path.join(
+        tempfile.gettempdir(), f"social-cookie-jar-{uid}.sock"
+    )
+
+
+def forward(
+    argv: list[str], socket_path: Optional[str] = None, timeout: float = REPLY_TIMEOUT
+) -> Optional[dict]:
+    """Run a CLI command in the daemon. Returns None if no daemon takes it.
+
+    Only a daemon that cannot be reached, or that declines the request,
+    counts as not running. Once the request is sent the daemon may act on
+    it, so a missing reply (after `timeout` seconds, or a dropped
+    connection) is reported as a failure rather than run a second time here.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path or default_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    try:
+        sock.settimeout(timeout)
+        with sock, sock.makefile("rwb") as f:
+            f.write(json.dumps({"argv": argv, "cwd": os.getcwd()}).encode() + b"\n")
+            f.flush()
+            line = f.readline()
+    except TimeoutError:
+        print(f"[daemon] No reply within {timeout:g}s; the command may still be running there",
+              file=sys.stderr)
+        return {"stdout": "", "exit": 1}
+    except OSError as e:
+        print(f"[daemon] Connection lost ({e}); the command may have run there", file=sys.stderr)
+        return {"stdout": "", "exit": 1}
+    if not line:
+        print("[daemon] Connection closed without a reply; the command may have run there",
+              file=sys.stderr)
+        return {"stdout": "", "exit": 1}
+    reply = json.loads(line)
+    return None if "error" in reply else reply
+
+
+class DriverPool:
+    """Live drivers keyed by platform and constructor options."""
+
+    def __init__(
+        self, idle_timeout: float = 600, health_interval: float = HEALTH_INTERVAL,
+        **driver_defaults,
+    ):
+        self.idle_timeout = idle_timeout
+        self.health_interval = health_interval
+        # Constructor arguments for every driver, e.g. the watchdog limits
+        self.driver_defaults = driver_defaults
+        # key -> {"driver", "used", "checked"}
+        self._entries: dict[tuple, dict] = {}
+
+    def get(self, platform: str, **kwargs):
+        from .registry import DRIVERS
+
+        key = (platform, tuple(sorted(kwargs.items())))
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {
+                "driver": DRIVERS[platform](**{**self.driver_defaults, **kwargs}),
+                "used": 0.0,
+                "checked": time.monotonic(),
+            }
+        entry["used"] = time.monotonic()
+        return entry["driver"]
+
+    def discard(self, driver):
+        """Quit a driver and drop it from the pool."""
+        for key, entry in list(self._entries.items()):
+            if entry["driver"] is driver:
+                with contextlib.suppress(Exception):
+                    driver.quit()
+                del self._entries[key]
+
+    def reap(self):
+        """Quit drivers idle longer than idle_timeout; health-check the rest.
+
+        Called between requests about once a second; each driver's health
+        check (a CDP call and a /proc walk) runs at most every health_interval.
+        """
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if now - entry["used"] > self.idle_timeout:
+                print(f"[{key[0]}] Idle for {self.idle_timeout:g}s, shutting down")
+                with contextlib.suppress(Exception):
+                    entry["driver"].quit()
+                del self._entries[key]
+            elif self.driver_defaults and now - entry["checked"] >= self.health_interval:
+                entry["checked"] = now
+                try:
+                    entry["driver"].check_health()
+                except Exception as e:
+                    print(f"[{key[0]}] Health check failed ({type(e).__name__}: {e}), dropping")
+                    self.discard(entry["driver"])
+
+    def close(self):
+        for entry in self._entries.values():
+            with contextlib.suppress(Exception):
+                entry["driver"].quit()
+        self._entries.clear()
+
+
+def serve(socket_path: Optional[str] = None, idle_timeout: float = 600, **driver_defaults):
+    """Serve CLI requests until interrupted; `driver_defaults` go to every driver."""
+    import socketserver
+
+    from .__main__ import main
+    from .metrics import REGISTRY as METRICS
+
+    path = socket_path or default_socket_path()
+    pool = DriverPool(idle_timeout, **driver_defaults)
+    cwd = os.getcwd()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            request = json.loads(self.rfile.readline())
+            if request.get("cwd") != cwd:
+                reply = {"error": f"daemon serves {cwd}"}
+            else:
+                out = io.StringIO()
+                code = 0
+                argv = sys.argv
+                sys.argv = ["social_cookie_jar", *request["argv"]]
+                try:
+                    with contextlib.redirect_stdout(out):
+                        main(pool=pool)
+                except SystemExit as e:
+                    code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception as e:
+                    out.write(f"[daemon] {type(e).__name__}: {e}\n")
+                    code = 1
+                finally:
+                    sys.argv = argv
+                    # The registry only flushes at exit; stats should see this call now
+                    with contextlib.suppress(OSError):
+                        METRICS.flush()
+                reply = {"stdout": out.getvalue(), "exit": code}
+            self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+    class Server(socketserver.UnixStreamServer):
+        def service_actions(self):
+            pool.reap()
+
+    if os.path.exists(path):
+        if _listening(path):
+            print(f"A daemon is already listening on {path}")
+            return
+        os.unlink(path)
+
+    # Quit the browsers on SIGTERM too, not just Ctrl-C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    server = Server(path, Handler)
+    os.chmod(path, 0o600)
+    print(f"Serving on {path} (idle timeout {idle_timeout:g}s)")
+    try:
+        server.serve_forever(poll_interval=1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+
+def _listening(path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+            return True
+        except OSError:
+            return False
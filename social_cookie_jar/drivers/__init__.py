@@ -1,11 +1,220 @@
 """Base driver with shared Selenium utilities."""
 
+import contextlib
+import functools
+import inspect
+import json
+import sys
+import threading
 import time
+from collections.abc import Iterator
+from dataclasses import asdict
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
 
+from .. import tracing
 from ..cookie_jar import CookieJar
+from ..feed_cache import FeedCache
+from ..launch import LAUNCH_PROFILES, kill_tree, renderers, tree_rss
+from ..login_cache import LoginCache, fingerprint
+from ..metrics import REGISTRY as METRICS, timed
+from ..profiles import DEFAULT_MAX_MB, profile_path, trim_profile
+from ..seen import SeenIndex
+from ..tracing import traced
+from .shared import SharedBrowser
+
+
+# Structured extraction of feed items, run in the page in one round-trip.
+# Each field spec is a list of alternatives: "css" reads the text of the first
+# match inside the item (href for "url"), "css@attr" reads an attribute of
+# that match and "@attr" reads an attribute of the item itself.
+# With `unseen`, only nodes not returned by an earlier call are considered.
+_EXTRACT_JS = """
+const [selector, fields, limit, maxLen, container, last, unseen] = arguments;
+let nodes = Array.from(document.querySelectorAll(selector));
+if (unseen) {
+    const seen = window.__scjSeen = window.__scjSeen || new WeakSet();
+    nodes = nodes.filter((n) => !seen.has(n));
+}
+nodes = last ? nodes.slice(-limit) : nodes.slice(0, limit);
+if (unseen) nodes.forEach((n) => window.__scjSeen.add(n));
+const read = (root, key, spec) => {
+    const at = spec.lastIndexOf("@");
+    const css = at >= 0 ? spec.slice(0, at) : spec;
+    const attr = at >= 0 ? spec.slice(at + 1) : "";
+    const el = css ? root.querySelector(css) : root;
+    if (!el) return "";
+    let v = attr ? el.getAttribute(attr) : (key === "url" ? el.href : el.innerText);
+    if (!v) return "";
+    if (key === "url") {
+        try { v = new URL(v, location.href).href; } catch (e) {}
+    }
+    return v.trim();
+};
+return nodes.map((node) => {
+    const root = container ? node.closest(container) : node;
+    if (!root) return null;
+    const rec = {text: (root.innerText || "").slice(0, maxLen)};
+    for (const [key, specs] of Object.entries(fields)) {
+        rec[key] = "";
+        for (const spec of specs) {
+            const v = read(root, key, spec);
+            if (v) { rec[key] = key === "url" ? v : v.slice(0, maxLen); break; }
+        }
+    }
+    if (!rec.title) rec.title = rec.text.split("\\n")[0];
+    return rec;
+});
+"""
+
+# Scroll past the last item to trigger loading more
+_SCROLL_JS = """
+const [selector] = arguments;
+const nodes = document.querySelectorAll(selector);
+if (nodes.length) nodes[nodes.length - 1].scrollIntoView({block: "end"});
+window.scrollBy(0, window.innerHeight);
+"""
+
+# Number of items not yet returned by an `unseen` extraction
+_UNSEEN_JS = """
+const seen = window.__scjSeen || new WeakSet();
+return Array.from(document.querySelectorAll(arguments[0])).filter((n) => !seen.has(n)).length;
+"""
+
+
+def _feed_key(driver, method, args, kwargs) -> list:
+    """Cache key for a feed call: platform, method and its bound arguments (incl. limit)."""
+    bound = inspect.signature(method).bind(driver, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self", None)
+    return [driver.PLATFORM, method.__name__, arguments]
+
+
+def _seen_feed(key: list) -> str:
+    """Seen-index feed name for a feed key: the method and its arguments, minus limit."""
+    _, name, arguments = key
+    arguments = {k: v for k, v in arguments.items() if k != "limit"}
+    return f"{name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+
+
+def _item_key(item) -> str:
+    """Stable id of a feed item: its URL or permalink, else its text."""
+    data = asdict(item)
+    for field in ("url", "permalink", "id", "text", "title"):
+        if data.get(field):
+            return str(data[field])
+    return repr(data)
+
+
+def _cached(driver, method, key, args, kwargs) -> Iterator:
+    """Run `method`, or replay it from the driver's feed cache when fresh.
+
+    On a miss the items are streamed through as usual and stored once the
+    generator is exhausted; a caller that stops early stores nothing.
+    """
+    if driver.feed_cache is None:
+        yield from method(driver, *args, **kwargs)
+        return
+    # Replay the entry has_fresh_feed() found, even if it expired since:
+    # the caller skipped login() on the strength of it
+    pinned, driver._fresh_feed = driver._fresh_feed, None
+    hit = pinned[1] if pinned and pinned[0] == key else driver.feed_cache.get(key)
+    if hit is not None:
+        item_cls = getattr(sys.modules[method.__module__], hit["type"])
+        for data in hit["items"]:
+            yield item_cls(**data)
+        return
+    items = []
+    for item in method(driver, *args, **kwargs):
+        items.append(item)
+        yield item
+    if items:
+        driver.feed_cache.put(key, type(items[0]).__name__, [asdict(i) for i in items])
+
+
+def feed_reader(method):
+    """Wrap an iter_feed() generator with the feed cache and the seen-index.
+
+    Results come from the driver's feed cache when it is enabled and fresh.
+    With `only_new=True` (keyword only), items whose stable id is already in
+    the driver's seen-index are dropped; the rest are recorded as they are
+    yielded, so the next poll returns only what appeared since.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, only_new: bool = False, **kwargs):
+        key = _feed_key(self, method, args, kwargs)
+        items = _cached(self, method, key, args, kwargs)
+        if not only_new:
+            yield from items
+            return
+        feed = _seen_feed(key)
+        try:
+            for item in items:
+                if self.seen.is_new(self.PLATFORM, feed, _item_key(item)):
+                    yield item
+        finally:
+            self.seen.evict(self.PLATFORM, feed)
+
+    return wrapper
+
+
+def _verified_login(login):
+    """Wrap a driver's login() with the login cache.
+
+    While the driver's login cache holds a verification of the current
+    session cookies younger than its TTL, login() only injects the cookies
+    and skips the verification page. Otherwise the full login() runs and
+    its outcome is recorded (or the record dropped).
+    """
+    @functools.wraps(login)
+    def wrapper(self, *args, **kwargs):
+        cache = self.login_cache
+        if cache is None:
+            self.logged_in = login(self, *args, **kwargs)
+            return self.logged_in
+        stamp = fingerprint(self.jar.load(self.PLATFORM) or [], self.SESSION_COOKIES)
+        if cache.get(self.PLATFORM, stamp):
+            self.logged_in = self.inject_cookies()
+            if not self.logged_in:
+                cache.forget(self.PLATFORM)
+                return False
+            METRICS.inc("login_cache_hits_total", platform=self.PLATFORM)
+            print(f"[{self.PLATFORM}] Session verified recently ✓")
+            return True
+        ok = self.logged_in = login(self, *args, **kwargs)
+        if ok and stamp:
+            cache.put(self.PLATFORM, stamp)
+        elif not ok:
+            cache.forget(self.PLATFORM)
+        return ok
+
+    return wrapper
+
+
+def _lite_read(method):
+    """Run a read-only action in lite mode and report the bytes it transferred.
+
+    See BaseDriver.LITE_METHODS; generator methods stay generators.
+    """
+    if inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def gen_wrapper(self, *args, **kwargs):
+            with self._reading(method.__name__):
+                yield from method(self, *args, **kwargs)
+
+        return gen_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._reading(method.__name__):
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class BaseDriver:
@@ -14,6 +223,45 @@ class BaseDriver:
     PLATFORM = "base"
     BASE_URL = ""
     SESSION_COOKIES: list[str] = []
+    # Whether every SESSION_COOKIES entry is needed, or any one of them
+    SESSION_REQUIRES_ALL = True
+    # CSS selector that appears once the app shell has rendered (logged in or not)
+    READY_SELECTOR = ""
+    # CSS selector matching one item in the platform's feed
+    FEED_SELECTOR = ""
+    # URL fragments of the pages a logged-out visitor is redirected to
+    LOGGED_OUT_URLS: tuple[str, ...] = ("/login",)
+    # Read-only actions that run in lite mode unless the driver has lite=False
+    LITE_METHODS = frozenset(
+        {"feed", "iter_feed", "read_channel", "notifications", "profile", "check_package"}
+    )
+    # Network.setBlockedURLs patterns for lite mode: images, media and fonts,
+    # by a path ending in the extension (a pattern must match the whole URL).
+    # Platforms add their media CDN hosts (not the hosts serving their JS).
+    LITE_BLOCKED_URLS: tuple[str, ...] = tuple(
+        pattern
+        for ext in (
+            "jpg", "jpeg", "png", "gif", "webp", "avif", "ico", "svg",
+            "mp4", "webm", "m3u8", "m4s", "mp3",
+            "woff", "woff2", "ttf", "otf",
+        )
+        for pattern in (f"*.{ext}", f"*.{ext}?*")
+    )
+
+    WAIT_POLL = 0.1
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Each public platform method is counted and timed in the metrics
+        # registry, and is a "{platform}.{method}" span when tracing
+        for name, fn in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(fn):
+                if name == "login":
+                    fn = _verified_login(fn)
+                if name in cls.LITE_METHODS:
+                    fn = _lite_read(fn)
+                fn = traced(f"{cls.PLATFORM}.{name}")(fn)
+                setattr(cls, name, timed(cls.PLATFORM, name)(fn))
 
     def __init__(
         self,
@@ -25,20 +273,94 @@ class BaseDriver:
         ),
         window_size: tuple[int, int] = (1280, 800),
         page_load_timeout: int = 25,
+        wait_timeout: float = 10.0,
+        cookie_store: str = "pickle",
+        feed_cache_ttl: float = 0,
+        login_cache_ttl: float = 0,
+        base_url: str = "",
+        browser: SharedBrowser | None = None,
+        profile_dir: str | None = None,
+        profile_max_mb: float = DEFAULT_MAX_MB,
+        lite: bool | None = None,
+        launch_profile: str = "default",
+        max_heap_mb: float = 0,
+        max_rss_mb: float = 0,
+        ping_timeout: float = 0,
     ):
-        self.jar = CookieJar(cookie_dir)
+        # Point the driver at another origin, e.g. a local fixture server
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
+        self.jar = CookieJar(cookie_dir, store=cookie_store)
+        # Non-cookie files live in state/, where the pickle store does not look for jars
+        METRICS.attach(self.jar.cookie_dir / "state" / "metrics.json")
+        # Opt-in: feed results are cached in state/ for this many seconds
+        self.feed_cache = (
+            FeedCache(self.jar.cookie_dir / "state" / "feed_cache", ttl=feed_cache_ttl)
+            if feed_cache_ttl > 0 else None
+        )
+        # Opt-in: trust a successful login() for this many seconds
+        self.login_cache = (
+            LoginCache(self.jar.cookie_dir / "state" / "logins.json", ttl=login_cache_ttl)
+            if login_cache_ttl > 0 else None
+        )
+        # Set by login(); cleared when a page load lands on a login page (see open())
+        self.logged_in = False
         self.headless = headless
         self.user_agent = user_agent
         self.window_size = window_size
         self.page_load_timeout = page_load_timeout
+        self.wait_timeout = wait_timeout
+        # Opt-in: run in a tab of a shared Chrome instead of launching one
+        self.browser = browser
+        # Opt-in: keep Chrome's cache and cookies in {profile_dir}/{PLATFORM}
+        self.user_data_dir = profile_path(profile_dir, self.PLATFORM) if profile_dir else None
+        self.profile_max_bytes = int(profile_max_mb * 2**20)
+        # Extra Chrome flags from launch.LAUNCH_PROFILES, e.g. "low-memory"
+        if launch_profile not in LAUNCH_PROFILES:
+            raise ValueError(f"Unknown launch profile: {launch_profile}")
+        self.launch_profile = launch_profile
+        # Opt-in watchdog thresholds, checked before each navigation (0 = off)
+        self.max_heap_bytes = int(max_heap_mb * 2**20)
+        self.max_rss_bytes = int(max_rss_mb * 2**20)
+        self.ping_timeout = ping_timeout
+        # Block LITE_BLOCKED_URLS: None for LITE_METHODS only, True always, False never
+        self.lite = lite
+        self._lite_applied = False
+        self._reads = 0
+        # Response bytes (encodedDataLength) seen in the performance log, and
+        # the share of the last LITE_METHODS call
+        self.bytes_received = 0
+        self.last_bytes = 0
+        self._handle: str | None = None
         self._driver = None
+        self._inflight: set[str] = set()
+        self._seen = None
+        # (key, entry) found by has_fresh_feed(), replayed by the next matching read
+        self._fresh_feed = None
+        # Last page open() loaded, for restoring it after a Chrome restart
+        self._last_url = ""
+
+    @property
+    def seen(self) -> SeenIndex:
+        """Items already returned by `only_new` reads, shared by all platforms in cookie_dir."""
+        if self._seen is None:
+            self._seen = SeenIndex(self.jar.cookie_dir / "state" / "seen.db")
+        return self._seen
 
     @property
     def driver(self):
         if self._driver is None:
-            self._driver = self._create_driver()
+            if self.browser is not None:
+                self._handle = self.browser.open_tab(self._create_driver)
+                self._driver = self.browser.driver
+            else:
+                self._driver = self._create_driver()
+        if self.browser is not None:
+            # Commands from this thread now go to our tab
+            self.browser.activate(self._handle)
         return self._driver
 
+    @traced("driver.create")
     def _create_driver(self):
         opts = Options()
         if self.headless:
@@ -50,22 +372,529 @@ class BaseDriver:
         opts.add_argument("--disable-notifications")
         opts.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
         opts.add_argument(f"--user-agent={self.user_agent}")
+        for flag in LAUNCH_PROFILES[self.launch_profile]:
+            opts.add_argument(flag)
+        if self.user_data_dir is not None:
+            self.user_data_dir.mkdir(parents=True, exist_ok=True)
+            trim_profile(self.user_data_dir, self.profile_max_bytes)
+            opts.add_argument(f"--user-data-dir={self.user_data_dir.resolve()}")
+            # Leave room under the cap for service workers and code cache
+            opts.add_argument(f"--disk-cache-size={self.profile_max_bytes // 2}")
+        # Network events for wait_for_network_idle()
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        opts.add_experimental_option(
+            "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+        )
         d = webdriver.Chrome(options=opts)
+        METRICS.inc("browser_launches_total", platform=self.PLATFORM)
         d.set_page_load_timeout(self.page_load_timeout)
+        if tracing.enabled():
+            tracing.instrument_webdriver(d)
         return d
 
+    def browser_rss(self) -> int:
+        """Resident memory in bytes of this driver's Chrome process tree.
+
+        Counts every process under ChromeDriver (browser, renderers, GPU and
+        utility processes); with a shared browser that is all its tabs.
+        Returns 0 before Chrome has started, or where /proc is missing.
+        """
+        if self._driver is None:
+            return 0
+        try:
+            return tree_rss(self._driver.service.process.pid)
+        except AttributeError:
+            return 0  # Remote or already quit
+
+    def browser_renderers(self) -> int:
+        """Number of renderer processes in this driver's Chrome (0 before start)."""
+        if self._driver is None:
+            return 0
+        try:
+            return len(renderers(self._driver.service.process.pid))
+        except AttributeError:
+            return 0
+
+    def preflight(self):
+        """Check the saved session offline from SESSION_COOKIES and their expiry."""
+        return self.jar.preflight(
+            self.PLATFORM, self.SESSION_COOKIES, require_all=self.SESSION_REQUIRES_ALL
+        )
+
+    @traced("inject_cookies")
+    def inject_cookies(self) -> bool:
+        """Inject saved cookies into the browser, reporting any the browser rejected.
+
+        Fails before Chrome is started if preflight() shows the saved
+        session is missing or expired. On Chrome the injection happens over
+        CDP without loading a page, so the caller's next navigation is the
+        only one login() needs. With a persistent profile whose own cookies
+        still hold a session, nothing is injected.
+        """
+        if self.user_data_dir is not None and self.profile_session_valid():
+            return True
+        check = self.preflight()
+        if not check:
+            print(f"[{self.PLATFORM}] Preflight failed: {check.describe()}")
+            return False
+        result = self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL)
+        for name, reason in result.rejected.items():
+            print(f"[{self.PLATFORM}] Cookie {name} rejected: {reason}")
+        return bool(result)
+
+    def profile_session_valid(self) -> bool:
+        """True if the Chrome profile already holds unexpired SESSION_COOKIES.
+
+        Reads the browser's cookie store over CDP without loading a page.
+        """
+        try:
+            cookies = self.driver.execute_cdp_cmd(
+                "Network.getCookies", {"urls": [self.BASE_URL]}
+            )["cookies"]
+        except Exception:
+            return False
+        now = time.time()
+        # expires is -1 for session cookies
+        names = {c["name"] for c in cookies if c.get("expires", -1) <= 0 or c["expires"] > now}
+        present = [n in names for n in self.SESSION_COOKIES]
+        return bool(present) and (all(present) if self.SESSION_REQUIRES_ALL else any(present))
+
     def login(self) -> bool:
         """Login using saved cookies. Returns True if session is valid."""
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             return False
-        self.driver.refresh()
-        time.sleep(3)
+        self.open(self.BASE_URL, self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         return all(name in cookie_names for name in self.SESSION_COOKIES)
 
+    # ── Waiting ──
+
+    def wait_until(self, condition, timeout: float | None = None):
+        """Poll `condition(driver)` until it returns something truthy.
+
+        Returns the truthy value, or None if `timeout` (default
+        `wait_timeout`) elapses first. Transient WebDriver errors such as
+        stale elements count as "not yet".
+        """
+        timeout = self.wait_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                result = condition(self.driver)
+            except WebDriverException:
+                result = None
+            if result:
+                return result
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.WAIT_POLL)
+
+    @traced("wait_for_document")
+    def wait_for_document(self, timeout: float | None = None) -> bool:
+        """Wait for document.readyState to reach "complete"."""
+        return bool(self.wait_until(
+            lambda d: d.execute_script("return document.readyState") == "complete",
+            timeout,
+        ))
+
+    @traced("wait_for", "selector")
+    def wait_for(self, selector: str, timeout: float | None = None, min_count: int = 1) -> list:
+        """Wait until `selector` matches at least `min_count` elements.
+
+        Returns the matching elements, or an empty list on timeout.
+        """
+        if not selector:
+            self.wait_for_document(timeout)
+            return []
+
+        def found(d):
+            els = d.find_elements(By.CSS_SELECTOR, selector)
+            return els if len(els) >= min_count else None
+
+        els = self.wait_until(found, timeout)
+        if not els:
+            METRICS.inc("selector_misses_total", platform=self.PLATFORM, selector=selector)
+        return els or []
+
+    @traced("wait_for_clickable", "selector")
+    def wait_for_clickable(self, selector: str, timeout: float | None = None):
+        """Wait for the first visible, enabled element matching `selector`."""
+        def clickable(d):
+            for el in d.find_elements(By.CSS_SELECTOR, selector):
+                if (
+                    el.is_displayed()
+                    and el.is_enabled()
+                    and el.get_attribute("aria-disabled") != "true"
+                ):
+                    return el
+            return None
+
+        el = self.wait_until(clickable, timeout)
+        if el is None:
+            METRICS.inc("selector_misses_total", platform=self.PLATFORM, selector=selector)
+        return el
+
+    @traced("wait_for_stable", "selector")
+    def wait_for_stable(
+        self,
+        selector: str,
+        timeout: float | None = None,
+        settle: float = 0.75,
+        min_count: int = 1,
+    ) -> list:
+        """Wait until the number of elements matching `selector` stops changing.
+
+        The count must be at least `min_count` and unchanged for `settle`
+        seconds. Returns whatever matches when the count settles or the
+        timeout elapses.
+        """
+        state = {"count": -1, "since": time.monotonic(), "els": []}
+
+        def stable(d):
+            els = d.find_elements(By.CSS_SELECTOR, selector)
+            now = time.monotonic()
+            if len(els) != state["count"]:
+                state.update(count=len(els), since=now)
+            state["els"] = els
+            return len(els) >= min_count and now - state["since"] >= settle
+
+        self.wait_until(stable, timeout)
+        return state["els"]
+
+    def _drain_network_log(self):
+        """Update the set of in-flight requests from Chrome's performance log."""
+        try:
+            if self.browser is not None:
+                entries = self.browser.log_entries(self._handle) if self._handle else []
+            else:
+                entries = self.driver.get_log("performance")
+        except WebDriverException:
+            return
+        for entry in entries:
+            msg = json.loads(entry["message"])["message"]
+            method = msg.get("method", "")
+            request_id = msg.get("params", {}).get("requestId")
+            if not request_id:
+                continue
+            if method == "Network.requestWillBeSent":
+                self._inflight.add(request_id)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                self._inflight.discard(request_id)
+                self.bytes_received += int(msg["params"].get("encodedDataLength", 0))
+
+    @traced("wait_for_network_idle")
+    def wait_for_network_idle(
+        self,
+        timeout: float | None = None,
+        idle: float = 0.5,
+        max_inflight: int = 2,
+    ) -> bool:
+        """Wait until at most `max_inflight` requests are pending for `idle` seconds.
+
+        Request tracking comes from CDP Network events in Chrome's
+        performance log. `max_inflight` tolerates the long-polling
+        connections most SPAs keep open.
+        """
+        state = {"since": None}
+
+        def quiet(d):
+            self._drain_network_log()
+            now = time.monotonic()
+            if len(self._inflight) > max_inflight:
+                state["since"] = None
+                return False
+            if state["since"] is None:
+                state["since"] = now
+            return now - state["since"] >= idle
+
+        return bool(self.wait_until(quiet, timeout))
+
+    @traced("open", "url")
+    def open(self, url: str, ready: str = "", timeout: float | None = None) -> list:
+        """Navigate to `url` and wait for `ready` to match.
+
+        With no `ready` selector this waits for the document to finish
+        loading. Returns the elements matching `ready`.
+        """
+        if self._driver is not None:
+            self.check_health(restore=False)
+        self._drain_network_log()
+        self._inflight.clear()
+        lite = self.lite if self.lite is not None else self._reads > 0
+        if lite != self._lite_applied:
+            self._block_urls(self.LITE_BLOCKED_URLS if lite else [])
+            self._lite_applied = lite
+        self._last_url = url
+        self.driver.get(url)
+        if self.logged_in:
+            self._check_logged_out(url)
+        return self.wait_for(ready, timeout)
+
+    def _check_logged_out(self, url: str):
+        """Notice a redirect from `url` to a login page: the session has ended."""
+        landed = self.driver.current_url
+        if any(m in landed and m not in url for m in self.LOGGED_OUT_URLS):
+            print(f"[{self.PLATFORM}] Redirected to {landed}; session is logged out")
+            self.logged_in = False
+            if self.login_cache is not None:
+                self.login_cache.forget(self.PLATFORM)
+
+    def _block_urls(self, patterns):
+        """Make Chrome fail requests matching `patterns` (glob-style, `*` wildcards)."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        except (AttributeError, WebDriverException):
+            pass  # Not Chrome; load everything
+
+    @contextlib.contextmanager
+    def _reading(self, action: str):
+        """Lite mode for the calls inside; the outermost one records its bytes.
+
+        The figure goes to last_bytes and the metrics only: read results are
+        printed and parsed, so nothing is added to stdout.
+        """
+        self._reads += 1
+        start = self.bytes_received
+        try:
+            yield
+        finally:
+            self._reads -= 1
+            if not self._reads and self._driver is not None:
+                self._drain_network_log()
+                self.last_bytes = self.bytes_received - start
+                METRICS.inc(
+                    "bytes_received_total", self.last_bytes,
+                    platform=self.PLATFORM, action=action,
+                )
+
+    # ── Health ──
+
+    def check_health(self, restore: bool = True) -> str:
+        """Recycle the tab or Chrome if it is hung or over its memory limits.
+
+        In order: a page that does not answer a script within `ping_timeout`
+        seconds gets Chrome killed and restarted; Chrome's process tree over
+        `max_rss_mb` is restarted; a page whose JS heap is over `max_heap_mb`
+        is moved to a fresh tab. A restarted Chrome gets the jar's cookies
+        again, and with `restore` the page that was open (for a hung page,
+        the last one open() loaded) is reloaded.
+        With a shared browser only the heap limit applies: the RSS and the
+        ping cover the whole Chrome, which one tab may not restart. Returns
+        what was done: "", "tab" or "browser".
+        """
+        if self._driver is None:
+            return ""
+        if self.ping_timeout and self.browser is None and not self._responsive():
+            self.restart_browser("hung", restore=restore)
+            return "browser"
+        # A shared Chrome's RSS is every tab's; recycling one tab would not
+        # bring it under the limit, so every driver would recycle on every open()
+        if self.max_rss_bytes and self.browser is None and self.browser_rss() > self.max_rss_bytes:
+            self.restart_browser("rss", restore=restore)
+            return "browser"
+        if self.max_heap_bytes and self._heap_used() > self.max_heap_bytes:
+            self.recycle_tab("heap", restore=restore)
+            return "tab"
+        return ""
+
+    def _responsive(self) -> bool:
+        """Whether the page runs a trivial script within ping_timeout seconds."""
+        answered = threading.Event()
+
+        def ping():
+            with contextlib.suppress(Exception):
+                self._driver.execute_script("return 1")
+                answered.set()
+
+        # A hung renderer blocks the WebDriver call, so wait for it on the side
+        threading.Thread(target=ping, name=f"scj-ping-{self.PLATFORM}", daemon=True).start()
+        return answered.wait(self.ping_timeout)
+
+    def _heap_used(self) -> int:
+        """Bytes of JS heap in use by the current page."""
+        try:
+            return int(self.driver.execute_cdp_cmd("Runtime.getHeapUsage", {})["usedSize"])
+        except (AttributeError, KeyError, WebDriverException):
+            return 0
+
+    def _current_url(self) -> str:
+        with contextlib.suppress(WebDriverException):
+            url = self.driver.current_url
+            if url.startswith("http"):
+                return url
+        return self._last_url
+
+    @traced("recycle_tab")
+    def recycle_tab(self, reason: str = "manual", restore: bool = True):
+        """Move to a fresh tab and close the old one, dropping its page state."""
+        url = self._current_url() if restore else ""
+        print(f"[{self.PLATFORM}] Recycling tab ({reason})")
+        old = self._handle or self.driver.current_window_handle
+        if self.browser is not None:
+            self._handle = self.browser.open_tab(self._create_driver)
+            self.browser.close_tab(old)
+            self.browser.activate(self._handle)
+        else:
+            new = self.driver.execute(Command.NEW_WINDOW, {"type": "tab"})["value"]["handle"]
+            self.driver.close()
+            self.driver.switch_to.window(new)
+        # Blocked URLs and in-flight requests belonged to the old tab
+        self._lite_applied = False
+        self._inflight.clear()
+        METRICS.inc("browser_recycles_total", platform=self.PLATFORM, kind="tab", reason=reason)
+        if url:
+            self.driver.get(url)
+
+    @traced("restart_browser")
+    def restart_browser(self, reason: str = "manual", restore: bool = True):
+        """Quit (or kill, if `reason` is "hung") Chrome and start a new one.
+
+        Cookies are saved first when Chrome still answers, then injected
+        into the new instance from the jar if the driver was logged in.
+        """
+        if self.browser is not None:
+            # Other drivers' tabs live in the same Chrome
+            self.recycle_tab(reason, restore=restore)
+            return
+        hung = reason == "hung"
+        # A hung page cannot be asked where it is
+        url = "" if not restore else self._last_url if hung else self._current_url()
+        print(f"[{self.PLATFORM}] Restarting Chrome ({reason})")
+        if not hung:
+            with contextlib.suppress(Exception):
+                self.save_cookies()
+        try:
+            pid = self._driver.service.process.pid
+        except AttributeError:
+            pid = None
+        if hung and pid:
+            kill_tree(pid)
+        with contextlib.suppress(Exception):
+            self._driver.quit()
+        self._driver = None
+        self._lite_applied = False
+        self._inflight.clear()
+        METRICS.inc(
+            "browser_recycles_total", platform=self.PLATFORM, kind="browser", reason=reason
+        )
+        if self.logged_in and not self.inject_cookies():
+            self.logged_in = False
+        if url:
+            self.driver.get(url)
+
+    # ── Extraction ──
+
+    @traced("extract", "selector")
+    def extract(
+        self,
+        selector: str,
+        fields: dict[str, list[str]] | None = None,
+        limit: int = 10,
+        max_len: int = 400,
+        container: str = "",
+        last: bool = False,
+        unseen: bool = False,
+    ) -> list[dict | None]:
+        """Extract structured records for items matching `selector` in one call.
+
+        Every record has `text` (truncated to `max_len` in the page) and
+        `title` (first line of text unless a `title` field matches), plus one
+        key per entry in `fields`. See `_EXTRACT_JS` for the field spec
+        syntax. With `container`, each match is replaced by its closest
+        ancestor matching it, or None if there is none. `last` takes the
+        final `limit` matches instead of the first. `unseen` skips items
+        returned by earlier `unseen` calls on the same page.
+        """
+        return self.driver.execute_script(
+            _EXTRACT_JS, selector, fields or {}, limit, max_len, container, last, unseen
+        ) or []
+
+    @traced("iter_items", "selector")
+    def iter_items(
+        self,
+        selector: str,
+        fields: dict[str, list[str]] | None = None,
+        limit: int = 10,
+        id_field: str = "id",
+        max_len: int = 400,
+        container: str = "",
+        scroll_timeout: float = 3.0,
+        max_idle: int = 2,
+    ) -> Iterator[dict | None]:
+        """Yield records from an infinite feed, scrolling for more as needed.
+
+        Items already on the page are yielded first; then the feed is
+        scrolled and new nodes are waited for (up to `scroll_timeout`).
+        Records are deduplicated on `id_field` (falling back to their text),
+        so nodes re-rendered by virtualised lists are not repeated. Stops at
+        `limit` items, or after `max_idle` scrolls that bring nothing new.
+        Records with neither, and None records (no `container` match), are
+        yielded without dedup.
+        """
+        seen: set[str] = set()
+        count = idle = 0
+        while count < limit:
+            # Only ship as many records as are still wanted
+            wanted = limit - count
+            batch = self.extract(
+                selector, fields, limit=wanted, max_len=max_len,
+                container=container, unseen=True,
+            )
+            fresh = False
+            for rec in batch:
+                key = rec and (rec.get(id_field) or rec["text"])
+                if key:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                fresh = True
+                yield rec
+                count += 1
+                if count >= limit:
+                    return
+
+            if len(batch) == wanted:
+                continue  # More unseen nodes may be on the page; take them before scrolling
+            idle = 0 if fresh else idle + 1
+            if idle >= max_idle:
+                return
+            self.driver.execute_script(_SCROLL_JS, selector)
+            self.wait_until(
+                lambda d: d.execute_script(_UNSEEN_JS, selector), scroll_timeout
+            )
+
+    def has_fresh_feed(self, *args, **kwargs) -> bool:
+        """True if iter_feed(*args, **kwargs) would be answered from the feed cache.
+
+        The entry is held for the next matching iter_feed() call, which
+        replays it even if it expires in between, so skipping login() on a
+        True answer never leads to a logged-out read.
+        """
+        self._fresh_feed = None
+        iter_feed = getattr(self, "iter_feed", None)
+        if self.feed_cache is None or iter_feed is None:
+            return False
+        method = inspect.unwrap(iter_feed)
+        if method is iter_feed:
+            return False
+        key = _feed_key(self, method, args, kwargs)
+        entry = self.feed_cache.get(key)
+        if entry is None:
+            return False
+        self._fresh_feed = (key, entry)
+        return True
+
     def save_cookies(self):
-        """Save current browser cookies to jar."""
-        self.jar.save(self.driver.get_cookies(), self.PLATFORM)
+        """Save current browser cookies to the jar if they changed.
+
+        Returns a CookieDiff with added/updated/removed counts and whether
+        anything was written.
+        """
+        diff = self.jar.save_if_changed(self.driver.get_cookies(), self.PLATFORM)
+        if diff.written:
+            METRICS.inc("cookie_writes_total", platform=self.PLATFORM)
+        return diff
 
     def paste_text(self, element, text: str):
         """Paste text into an element via ClipboardEvent. Instant, no typing."""
@@ -87,8 +916,16 @@ class BaseDriver:
     def quit(self):
         """Close the browser."""
         if self._driver:
-            self._driver.quit()
+            if self.browser is not None:
+                self.browser.close_tab(self._handle)
+                self._handle = None
+            else:
+                self._driver.quit()
             self._driver = None
+        if self._seen is not None:
+            self._seen.close()
+            self._seen = None
+        self.jar.close()
 
     def __enter__(self):
         return self
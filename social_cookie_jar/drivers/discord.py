@@ -1,8 +1,6 @@
 """Discord driver — post messages, read channels via discord.com."""
 
-import time
 from dataclasses import dataclass
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
 from . import BaseDriver
@@ -14,6 +12,7 @@ class DiscordMessage:
     index: int
     text: str
     author: str = ""
+    id: str = ""
 
 
 class DiscordDriver(BaseDriver):
@@ -27,13 +26,18 @@ class DiscordDriver(BaseDriver):
     PLATFORM = "discord"
     BASE_URL = "https://discord.com"
     SESSION_COOKIES = ["__dcfduid", "__sdcfduid"]
+    READY_SELECTOR = 'nav[aria-label], [class*="authBox"]'
+    FEED_SELECTOR = '[id^="chat-messages-"]'
+    LITE_BLOCKED_URLS = BaseDriver.LITE_BLOCKED_URLS + (
+        "*://cdn.discordapp.com/*", "*://media.discordapp.net/*",
+    )
+    TEXTBOX_SELECTOR = '[role="textbox"][contenteditable="true"]'
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[discord] No cookies found. Export them first.")
             return False
-        self.driver.get(f"{self.BASE_URL}/channels/@me")
-        time.sleep(6)
+        self.open(f"{self.BASE_URL}/channels/@me", self.READY_SELECTOR)
         # Check if redirected to login
         if "/login" in self.driver.current_url:
             print("[discord] Cookie session expired.")
@@ -41,27 +45,44 @@ class DiscordDriver(BaseDriver):
         print("[discord] Logged in via cookies ✓")
         return True
 
-    def read_channel(self, guild_id: str, channel_id: str, limit: int = 20) -> list[DiscordMessage]:
-        """Read messages from a channel."""
-        self.driver.get(f"{self.BASE_URL}/channels/{guild_id}/{channel_id}")
-        time.sleep(5)
+    def read_channel(
+        self, guild_id: str, channel_id: str, limit: int = 20, only_new: bool = False
+    ) -> list[DiscordMessage]:
+        """Read messages from a channel.
 
-        msg_els = self.driver.find_elements(
-            By.CSS_SELECTOR, '[id^="chat-messages-"]'
+        With `only_new`, only messages newer than the last one returned by
+        a previous `only_new` read of this channel are kept; the cursor is
+        stored in the driver's seen-index.
+        """
+        self.open(f"{self.BASE_URL}/channels/{guild_id}/{channel_id}", self.FEED_SELECTOR)
+        self.wait_for_stable(self.FEED_SELECTOR)
+        records = self.extract(
+            self.FEED_SELECTOR,
+            {"author": ['[id^="message-username-"]'], "id": ["@id"]},
+            limit=limit,
+            last=True,
         )
-        messages = []
-        for i, el in enumerate(msg_els[-limit:]):
-            text = el.text[:400]
-            messages.append(DiscordMessage(index=i, text=text))
+        messages = [
+            DiscordMessage(
+                index=i, text=r["text"], author=r["author"], id=r["id"].rpartition("-")[2]
+            )
+            for i, r in enumerate(records)
+        ]
+        if not only_new:
+            return messages
+
+        # Message ids are snowflakes, so they sort by creation time
+        feed = f"channel:{guild_id}/{channel_id}"
+        cursor = int(self.seen.get_cursor(self.PLATFORM, feed) or 0)
+        messages = [m for m in messages if m.id.isdigit() and int(m.id) > cursor]
+        if messages:
+            self.seen.set_cursor(self.PLATFORM, feed, max(messages, key=lambda m: int(m.id)).id)
         return messages
 
     def send_message(self, guild_id: str, channel_id: str, text: str) -> bool:
         """Send a message to a channel."""
-        self.driver.get(f"{self.BASE_URL}/channels/{guild_id}/{channel_id}")
-        time.sleep(5)
-
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR, '[role="textbox"][contenteditable="true"]'
+        boxes = self.open(
+            f"{self.BASE_URL}/channels/{guild_id}/{channel_id}", self.TEXTBOX_SELECTOR
         )
         if not boxes:
             print("[discord] Message box not found")
@@ -69,11 +90,9 @@ class DiscordDriver(BaseDriver):
 
         box = boxes[0]
         box.click()
-        time.sleep(0.3)
         self.paste_text(box, text)
-        time.sleep(1)
         box.send_keys(Keys.RETURN)
-        time.sleep(2)
+        self.wait_for_network_idle()
         self.save_cookies()
         print(f"[discord] Sent: {text[:80]}...")
         return True
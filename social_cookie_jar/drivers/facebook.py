@@ -1,11 +1,24 @@
 """Facebook driver — post, comment, read feeds via www.facebook.com."""
 
-import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
-from . import BaseDriver
+from . import BaseDriver, feed_reader
+
+# The comment box of the feed post linking to a permalink, found the same way
+# iter_feed() finds posts: from each comment box up to its container
+_COMMENT_BOX_JS = """
+const [boxSelector, container, url] = arguments;
+for (const box of document.querySelectorAll(boxSelector)) {
+    const post = box.closest(container);
+    if (post && Array.from(post.querySelectorAll("a[href]")).some((a) => a.href === url)) {
+        return box;
+    }
+}
+return null;
+"""
 
 
 @dataclass
@@ -28,16 +41,25 @@ class FacebookDriver(BaseDriver):
     PLATFORM = "facebook"
     BASE_URL = "https://www.facebook.com"
     SESSION_COOKIES = ["c_user", "xs"]
+    READY_SELECTOR = '[role="main"], [role="banner"], form[action*="login"]'
+    FEED_SELECTOR = '[role="article"]'
+    LITE_BLOCKED_URLS = BaseDriver.LITE_BLOCKED_URLS + (
+        "*://scontent*.fbcdn.net/*", "*://video*.fbcdn.net/*",
+    )
+    COMMENT_BOX_SELECTOR = (
+        'div[role="textbox"][aria-label*="comment" i], '
+        'div[role="textbox"][aria-label*="answer" i]'
+    )
+    TEXTBOX_SELECTOR = '[contenteditable="true"][role="textbox"]'
 
     def login(self) -> bool:
         """Login using saved cookies."""
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[fb] No cookies found. Export them first (see README).")
             return False
 
         # Verify session by visiting profile
-        self.driver.get(f"{self.BASE_URL}/me")
-        time.sleep(4)
+        self.open(f"{self.BASE_URL}/me", self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         logged_in = all(name in cookie_names for name in self.SESSION_COOKIES)
         if logged_in:
@@ -46,74 +68,69 @@ class FacebookDriver(BaseDriver):
             print("[fb] Cookie session expired. Re-export cookies.")
         return logged_in
 
-    def feed(self, group_id: str | None = None, limit: int = 10) -> list[Post]:
-        """Read the home feed or a group feed."""
+    @feed_reader
+    def iter_feed(self, group_id: str | None = None, limit: int = 10) -> Iterator[Post]:
+        """Stream posts from the home feed or a group feed, scrolling as needed."""
         if group_id:
-            self.driver.get(f"{self.BASE_URL}/groups/{group_id}/")
+            self.open(f"{self.BASE_URL}/groups/{group_id}/", self.FEED_SELECTOR)
         else:
-            self.driver.get(self.BASE_URL)
-        time.sleep(7)
-
-        # Scroll to load posts
-        self.driver.execute_script("window.scrollTo(0, 600);")
-        time.sleep(3)
-
-        # Extract body text and split into post sections
-        body = self.driver.find_element(By.TAG_NAME, "body").text
-        
-        # Find comment-related aria-labels to identify post boundaries
-        comment_boxes = self.driver.find_elements(
-            By.CSS_SELECTOR,
-            'div[role="textbox"][aria-label*="comment" i], '
-            'div[role="textbox"][aria-label*="answer" i]',
+            self.open(self.BASE_URL, self.FEED_SELECTOR)
+
+        # Comment boxes mark post boundaries; walk up to each post container
+        records = self.iter_items(
+            self.COMMENT_BOX_SELECTOR,
+            {
+                "url": ['a[href*="/posts/"]', 'a[href*="/permalink/"]'],
+                "author": ["h2", "h3", "strong"],
+            },
+            limit=limit,
+            id_field="url",
+            max_len=500,
+            container=self.FEED_SELECTOR,
         )
-
-        posts = []
-        for i, box in enumerate(comment_boxes[:limit]):
-            # Walk up to find the post container
-            try:
-                article = box.find_element(By.XPATH, "./ancestor::div[@role='article']")
-                text = article.text[:500]
-            except Exception:
-                text = f"(post {i} — text extraction failed)"
-
-            posts.append(Post(index=i, text=text))
-
-        return posts
+        # Posts by index, for comment_in_feed()
+        self._feed_posts: dict[int, Post] = {}
+        for i, r in enumerate(records):
+            if r is None:
+                post = Post(index=i, text=f"(post {i} — text extraction failed)")
+            else:
+                post = Post(index=i, text=r["text"], permalink=r["url"], author=r["author"])
+            self._feed_posts[i] = post
+            yield post
+
+    def feed(
+        self, group_id: str | None = None, limit: int = 10, only_new: bool = False
+    ) -> list[Post]:
+        """Read the home feed or a group feed."""
+        return list(self.iter_feed(group_id, limit, only_new=only_new))
 
     def post(self, text: str, profile_id: str | None = None) -> bool:
         """Post to own timeline."""
         if profile_id:
-            self.driver.get(f"{self.BASE_URL}/profile.php?id={profile_id}")
+            self.open(f"{self.BASE_URL}/profile.php?id={profile_id}", "[aria-label]")
         else:
-            self.driver.get(f"{self.BASE_URL}/me")
-        time.sleep(5)
+            self.open(f"{self.BASE_URL}/me", "[aria-label]")
 
         # Click composer
         composers = self.driver.find_elements(By.CSS_SELECTOR, "[aria-label]")
         for c in composers:
             if "mind" in (c.get_attribute("aria-label") or "").lower():
                 c.click()
-                time.sleep(3)
                 break
 
-        textboxes = self.driver.find_elements(
-            By.CSS_SELECTOR, '[contenteditable="true"][role="textbox"]'
-        )
+        textboxes = self.wait_for(self.TEXTBOX_SELECTOR)
         if not textboxes:
             print("[fb] Could not find composer textbox")
             return False
 
         textboxes[0].click()
-        time.sleep(0.5)
         self.paste_text(textboxes[0], text)
-        time.sleep(2)
 
-        # Click Post
-        buttons = self.driver.find_elements(By.CSS_SELECTOR, '[aria-label="Post"]')
-        if buttons:
-            buttons[0].click()
-            time.sleep(3)
+        # Click Post once it is enabled
+        button = self.wait_for_clickable('[aria-label="Post"]')
+        if button:
+            button.click()
+            self.wait_for_network_idle()
             self.save_cookies()
             print(f"[fb] Posted: {text[:80]}...")
             return True
@@ -123,12 +140,7 @@ class FacebookDriver(BaseDriver):
 
     def comment(self, post_url: str, text: str) -> bool:
         """Comment on a post by URL."""
-        self.driver.get(post_url)
-        time.sleep(6)
-
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR, '[contenteditable="true"][role="textbox"]'
-        )
+        boxes = self.open(post_url, self.TEXTBOX_SELECTOR)
         if not boxes:
             # Try clicking Comment button first
             btns = self.driver.find_elements(
@@ -137,11 +149,8 @@ class FacebookDriver(BaseDriver):
             for btn in btns:
                 if "leave" in (btn.get_attribute("aria-label") or "").lower():
                     btn.click()
-                    time.sleep(2)
                     break
-            boxes = self.driver.find_elements(
-                By.CSS_SELECTOR, '[contenteditable="true"][role="textbox"]'
-            )
+            boxes = self.wait_for(self.TEXTBOX_SELECTOR)
 
         if not boxes:
             print("[fb] No comment box found")
@@ -149,40 +158,41 @@ class FacebookDriver(BaseDriver):
 
         box = boxes[-1]
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(1)
         box.send_keys(Keys.RETURN)
-        time.sleep(2)
+        self.wait_for_network_idle()
         self.save_cookies()
         print(f"[fb] Commented: {text[:80]}...")
         return True
 
     def comment_in_feed(self, post_index: int, text: str) -> bool:
-        """Comment on the nth post in the currently loaded feed.
-        
-        Call feed() first to load the page, then use this.
+        """Comment on the post with this index in the feed read last.
+
+        Call feed() first to load the page, then use this. The post's comment
+        box is found by its permalink, so it is the post feed() returned even
+        if the page has changed since; posts without one are refused.
         """
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR,
-            'div[role="textbox"][aria-label*="comment" i], '
-            'div[role="textbox"][aria-label*="answer" i]',
+        post = getattr(self, "_feed_posts", {}).get(post_index)
+        if post is None:
+            print(f"[fb] Post {post_index} was not in the last feed read")
+            return False
+        if not post.permalink:
+            print(f"[fb] Post {post_index} has no permalink; use comment <url> instead")
+            return False
+        box = self.driver.execute_script(
+            _COMMENT_BOX_JS, self.COMMENT_BOX_SELECTOR, self.FEED_SELECTOR, post.permalink
         )
-        if post_index >= len(boxes):
-            print(f"[fb] Post {post_index} out of range ({len(boxes)} available)")
+        if box is None:
+            print(f"[fb] Post {post_index} is no longer on the page")
             return False
 
-        box = boxes[post_index]
         self.driver.execute_script(
             "arguments[0].scrollIntoView({block:'center'});", box
         )
-        time.sleep(1)
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(1)
         box.send_keys(Keys.RETURN)
-        time.sleep(2)
+        self.wait_for_network_idle()
         self.save_cookies()
         print(f"[fb] Commented on post {post_index}: {text[:80]}...")
         return True
@@ -1,10 +1,10 @@
 """Hacker News driver — submit, comment, read via news.ycombinator.com."""
 
-import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from selenium.webdriver.common.by import By
 
-from . import BaseDriver
+from . import BaseDriver, feed_reader
 
 
 @dataclass
@@ -23,13 +23,14 @@ class HackerNewsDriver(BaseDriver):
     PLATFORM = "hackernews"
     BASE_URL = "https://news.ycombinator.com"
     SESSION_COOKIES = ["user"]
+    READY_SELECTOR = "#hnmain, form"
+    FEED_SELECTOR = ".athing"
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[hn] No cookies found. Export them first.")
             return False
-        self.driver.get(self.BASE_URL)
-        time.sleep(3)
+        self.open(self.BASE_URL, self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         ok = "user" in cookie_names
         # Check for login link
@@ -41,8 +42,7 @@ class HackerNewsDriver(BaseDriver):
 
     def login_with_creds(self, username: str, password: str) -> bool:
         """Login with username/password (HN supports this directly)."""
-        self.driver.get(f"{self.BASE_URL}/login")
-        time.sleep(3)
+        self.open(f"{self.BASE_URL}/login")
         inputs = self.driver.find_elements(By.CSS_SELECTOR, 'input[type="text"], input[type="password"]')
         if len(inputs) < 2:
             print("[hn] Login form not found")
@@ -54,7 +54,7 @@ class HackerNewsDriver(BaseDriver):
         submit = self.driver.find_elements(By.CSS_SELECTOR, 'input[type="submit"]')
         if submit:
             submit[0].click()
-            time.sleep(3)
+            self.wait_for_document()
             self.save_cookies()
             body = self.driver.find_element(By.TAG_NAME, "body").text
             ok = "logout" in body[:300].lower()
@@ -62,24 +62,39 @@ class HackerNewsDriver(BaseDriver):
             return ok
         return False
 
-    def feed(self, page: str = "news", limit: int = 30) -> list[HNPost]:
+    @feed_reader
+    def iter_feed(self, page: str = "news", limit: int = 30) -> Iterator[HNPost]:
+        """Stream posts from a listing, following the "More" link across pages."""
+        url = f"{self.BASE_URL}/{page}"
+        seen: set[str] = set()
+        i = 0
+        while url and i < limit:
+            # HN is server-rendered: every row is present once the document loads
+            self.open(url)
+            records = self.extract(
+                self.FEED_SELECTOR,
+                {"id": ["@id"], "title": [".titleline a"], "url": [".titleline a"]},
+                limit=limit,
+            )
+            for r in records:
+                # Items shift between pages as rankings change
+                if r["id"] in seen:
+                    continue
+                seen.add(r["id"])
+                yield HNPost(index=i, title=r["title"] or f"Post {i}", url=r["url"])
+                i += 1
+                if i >= limit:
+                    return
+            more = self.driver.find_elements(By.CSS_SELECTOR, "a.morelink")
+            url = more[0].get_attribute("href") if more and records else ""
+
+    def feed(self, page: str = "news", limit: int = 30, only_new: bool = False) -> list[HNPost]:
         """Read front page or other pages (newest, ask, show)."""
-        self.driver.get(f"{self.BASE_URL}/{page}")
-        time.sleep(3)
-        rows = self.driver.find_elements(By.CSS_SELECTOR, ".athing")
-        posts = []
-        for i, row in enumerate(rows[:limit]):
-            title_el = row.find_elements(By.CSS_SELECTOR, ".titleline a")
-            title = title_el[0].text if title_el else f"Post {i}"
-            url = title_el[0].get_attribute("href") if title_el else ""
-            posts.append(HNPost(index=i, title=title, url=url))
-        return posts
+        return list(self.iter_feed(page, limit, only_new=only_new))
 
     def submit(self, title: str, url: str = "", text: str = "") -> bool:
         """Submit a new post."""
-        self.driver.get(f"{self.BASE_URL}/submit")
-        time.sleep(3)
-        inputs = self.driver.find_elements(By.CSS_SELECTOR, 'input[name="title"]')
+        inputs = self.open(f"{self.BASE_URL}/submit", 'input[name="title"]')
         if not inputs:
             print("[hn] Submit form not found")
             return False
@@ -100,7 +115,7 @@ class HackerNewsDriver(BaseDriver):
         submit = self.driver.find_elements(By.CSS_SELECTOR, 'input[type="submit"]')
         if submit:
             submit[0].click()
-            time.sleep(3)
+            self.wait_for_document()
             self.save_cookies()
             print(f"[hn] Submitted: {title[:80]}")
             return True
@@ -108,19 +123,16 @@ class HackerNewsDriver(BaseDriver):
 
     def comment(self, item_url: str, text: str) -> bool:
         """Comment on a post or reply to a comment."""
-        self.driver.get(item_url)
-        time.sleep(3)
-        textareas = self.driver.find_elements(By.CSS_SELECTOR, 'textarea[name="text"]')
+        textareas = self.open(item_url, 'textarea[name="text"]')
         if not textareas:
             print("[hn] Comment box not found")
             return False
         textareas[0].clear()
         textareas[0].send_keys(text)
-        time.sleep(0.5)
         submit = self.driver.find_elements(By.CSS_SELECTOR, 'input[type="submit"]')
         if submit:
             submit[0].click()
-            time.sleep(3)
+            self.wait_for_document()
             self.save_cookies()
             print(f"[hn] Commented: {text[:80]}...")
             return True
@@ -1,11 +1,11 @@
 """Instagram driver — post, read feed, comment via instagram.com."""
 
-import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
-from . import BaseDriver
+from . import BaseDriver, feed_reader
 
 
 @dataclass
@@ -27,13 +27,17 @@ class InstagramDriver(BaseDriver):
     PLATFORM = "instagram"
     BASE_URL = "https://www.instagram.com"
     SESSION_COOKIES = ["sessionid", "ds_user_id"]
+    READY_SELECTOR = 'main, [role="main"], form#loginForm'
+    FEED_SELECTOR = "article"
+    LITE_BLOCKED_URLS = BaseDriver.LITE_BLOCKED_URLS + (
+        "*://scontent*.cdninstagram.com/*", "*://scontent*.fbcdn.net/*",
+    )
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[ig] No cookies found. Export them first.")
             return False
-        self.driver.get(self.BASE_URL)
-        time.sleep(5)
+        self.open(self.BASE_URL, self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         ok = all(n in cookie_names for n in self.SESSION_COOKIES)
         if "/accounts/login" in self.driver.current_url:
@@ -41,23 +45,30 @@ class InstagramDriver(BaseDriver):
         print(f"[ig] {'Logged in via cookies ✓' if ok else 'Cookie session expired.'}")
         return ok
 
-    def feed(self, limit: int = 10) -> list[InstaPost]:
+    @feed_reader
+    def iter_feed(self, limit: int = 10) -> Iterator[InstaPost]:
+        """Stream posts from the home feed, scrolling as needed."""
+        self.open(self.BASE_URL, self.FEED_SELECTOR)
+        records = self.iter_items(
+            self.FEED_SELECTOR,
+            {
+                "author": ["header a[href^='/'] span", "header a[href^='/']"],
+                "url": ['a[href*="/p/"]', 'a[href*="/reel/"]'],
+            },
+            limit=limit,
+            id_field="url",
+        )
+        for i, r in enumerate(records):
+            yield InstaPost(index=i, text=r["text"], author=r["author"], url=r["url"])
+
+    def feed(self, limit: int = 10, only_new: bool = False) -> list[InstaPost]:
         """Read the home feed."""
-        self.driver.get(self.BASE_URL)
-        time.sleep(6)
-        articles = self.driver.find_elements(By.CSS_SELECTOR, "article")
-        posts = []
-        for i, art in enumerate(articles[:limit]):
-            text = art.text[:400]
-            posts.append(InstaPost(index=i, text=text))
-        return posts
+        return list(self.iter_feed(limit, only_new=only_new))
 
     def comment(self, post_url: str, text: str) -> bool:
         """Comment on a post by URL."""
-        self.driver.get(post_url)
-        time.sleep(5)
-        textareas = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        textareas = self.open(
+            post_url,
             'textarea[aria-label*="comment" i], textarea[placeholder*="comment" i]',
         )
         if not textareas:
@@ -65,14 +76,12 @@ class InstagramDriver(BaseDriver):
             return False
         ta = textareas[0]
         ta.click()
-        time.sleep(0.5)
         ta.send_keys(text)
-        time.sleep(1)
         post_btns = self.driver.find_elements(By.CSS_SELECTOR, 'button[type="submit"]')
         for btn in post_btns:
             if btn.text.strip().lower() == "post":
                 btn.click()
-                time.sleep(3)
+                self.wait_for_network_idle()
                 self.save_cookies()
                 print(f"[ig] Commented: {text[:80]}...")
                 return True
@@ -81,12 +90,10 @@ class InstagramDriver(BaseDriver):
 
     def like_post(self, post_url: str) -> bool:
         """Like a post by URL."""
-        self.driver.get(post_url)
-        time.sleep(5)
-        like_btns = self.driver.find_elements(By.CSS_SELECTOR, '[aria-label="Like"]')
+        like_btns = self.open(post_url, '[aria-label="Like"]')
         if like_btns:
             like_btns[0].click()
-            time.sleep(1)
+            self.wait_for_network_idle()
             print("[ig] Liked post")
             return True
         print("[ig] Like button not found")
@@ -1,11 +1,10 @@
 """LinkedIn driver — post, read feed, comment via linkedin.com."""
 
-import time
+from collections.abc import Iterator
 from dataclasses import dataclass
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
-from . import BaseDriver
+from . import BaseDriver, feed_reader
 
 
 @dataclass
@@ -14,6 +13,7 @@ class LinkedInPost:
     index: int
     text: str
     author: str = ""
+    url: str = ""
 
 
 class LinkedInDriver(BaseDriver):
@@ -22,13 +22,22 @@ class LinkedInDriver(BaseDriver):
     PLATFORM = "linkedin"
     BASE_URL = "https://www.linkedin.com"
     SESSION_COOKIES = ["li_at"]
+    READY_SELECTOR = ".scaffold-layout, main, form.login__form"
+    FEED_SELECTOR = '[data-urn*="activity"], .feed-shared-update-v2'
+    LOGGED_OUT_URLS = ("/login", "/authwall")
+    LITE_BLOCKED_URLS = BaseDriver.LITE_BLOCKED_URLS + (
+        "*://media.licdn.com/*", "*://dms.licdn.com/*",
+    )
+    TEXTBOX_SELECTOR = (
+        '[role="textbox"][contenteditable="true"], '
+        '.ql-editor[contenteditable="true"]'
+    )
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[li] No cookies found. Export them first.")
             return False
-        self.driver.get(f"{self.BASE_URL}/feed/")
-        time.sleep(5)
+        self.open(f"{self.BASE_URL}/feed/", self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         ok = "li_at" in cookie_names
         # Check for auth wall
@@ -37,64 +46,59 @@ class LinkedInDriver(BaseDriver):
         print(f"[li] {'Logged in via cookies ✓' if ok else 'Cookie session expired.'}")
         return ok
 
-    def feed(self, limit: int = 10) -> list[LinkedInPost]:
-        """Read the main feed."""
-        self.driver.get(f"{self.BASE_URL}/feed/")
-        time.sleep(6)
-        # Scroll to load
-        self.driver.execute_script("window.scrollTo(0, 800);")
-        time.sleep(3)
-
-        posts_el = self.driver.find_elements(
-            By.CSS_SELECTOR, '[data-urn*="activity"], .feed-shared-update-v2'
+    @feed_reader
+    def iter_feed(self, limit: int = 10) -> Iterator[LinkedInPost]:
+        """Stream posts from the main feed, scrolling as needed."""
+        self.open(f"{self.BASE_URL}/feed/", self.FEED_SELECTOR)
+        records = self.iter_items(
+            self.FEED_SELECTOR,
+            {
+                "id": ["@data-urn", "[data-urn]@data-urn"],
+                "author": [
+                    ".update-components-actor__title span[aria-hidden]",
+                    ".feed-shared-actor__name",
+                ],
+                "url": ['a[href*="/feed/update/"]'],
+            },
+            limit=limit,
         )
-        posts = []
-        for i, el in enumerate(posts_el[:limit]):
-            text = el.text[:400]
-            posts.append(LinkedInPost(index=i, text=text))
-        return posts
+        for i, r in enumerate(records):
+            yield LinkedInPost(index=i, text=r["text"], author=r["author"], url=r["url"])
+
+    def feed(self, limit: int = 10, only_new: bool = False) -> list[LinkedInPost]:
+        """Read the main feed."""
+        return list(self.iter_feed(limit, only_new=only_new))
 
     def post(self, text: str) -> bool:
         """Create a new post."""
-        self.driver.get(f"{self.BASE_URL}/feed/")
-        time.sleep(5)
-
         # Click "Start a post" button
-        starters = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        starters = self.open(
+            f"{self.BASE_URL}/feed/",
             'button.share-box-feed-entry__trigger, '
             '[aria-label*="Start a post"], '
             '[class*="share-box"] button',
         )
         if starters:
             starters[0].click()
-            time.sleep(3)
 
         # Find the textbox
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR,
-            '[role="textbox"][contenteditable="true"], '
-            '.ql-editor[contenteditable="true"]',
-        )
+        boxes = self.wait_for(self.TEXTBOX_SELECTOR)
         if not boxes:
             print("[li] Composer textbox not found")
             return False
 
         box = boxes[0]
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(2)
 
         # Click Post button
-        post_btn = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        post_btn = self.wait_for_clickable(
             'button.share-actions__primary-action, '
-            'button[aria-label*="Post" i]',
+            'button[aria-label*="Post" i]'
         )
         if post_btn:
-            post_btn[0].click()
-            time.sleep(4)
+            post_btn.click()
+            self.wait_for_network_idle()
             self.save_cookies()
             print(f"[li] Posted: {text[:80]}...")
             return True
@@ -103,48 +107,36 @@ class LinkedInDriver(BaseDriver):
 
     def comment(self, post_url: str, text: str) -> bool:
         """Comment on a LinkedIn post by URL."""
-        self.driver.get(post_url)
-        time.sleep(5)
-
         # Click comment button to open box
-        comment_btns = self.driver.find_elements(
-            By.CSS_SELECTOR, 'button[aria-label*="Comment" i]'
-        )
+        comment_btns = self.open(post_url, 'button[aria-label*="Comment" i]')
         if comment_btns:
             comment_btns[0].click()
-            time.sleep(2)
 
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR,
-            '[role="textbox"][contenteditable="true"], '
-            '.ql-editor[contenteditable="true"]',
-        )
+        boxes = self.wait_for(self.TEXTBOX_SELECTOR)
         if not boxes:
             print("[li] Comment box not found")
             return False
 
         box = boxes[-1]
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(1)
 
         # Submit
-        submit = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        submit = self.wait_for_clickable(
             'button.comments-comment-box__submit-button, '
             'button[aria-label*="Post comment" i]',
+            timeout=3,
         )
         if submit:
-            submit[0].click()
-            time.sleep(3)
+            submit.click()
+            self.wait_for_network_idle()
             self.save_cookies()
             print(f"[li] Commented: {text[:80]}...")
             return True
 
         # Fallback: Ctrl+Enter
         box.send_keys(Keys.CONTROL + Keys.RETURN)
-        time.sleep(3)
+        self.wait_for_network_idle()
         self.save_cookies()
         print(f"[li] Commented (Ctrl+Enter): {text[:80]}...")
         return True
@@ -1,6 +1,5 @@
 """PyPI driver — check package stats via pypi.org."""
 
-import time
 from dataclasses import dataclass
 from selenium.webdriver.common.by import By
 
@@ -28,11 +27,10 @@ class PyPIDriver(BaseDriver):
     SESSION_COOKIES = ["session_id"]
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[pypi] No cookies found. Export them first.")
             return False
-        self.driver.get(f"{self.BASE_URL}/manage/projects/")
-        time.sleep(5)
+        self.open(f"{self.BASE_URL}/manage/projects/")
         if "/account/login" in self.driver.current_url:
             print("[pypi] Not logged in.")
             return False
@@ -41,8 +39,8 @@ class PyPIDriver(BaseDriver):
 
     def check_package(self, name: str) -> PyPIPackage | None:
         """Check a package's info."""
-        self.driver.get(f"{self.BASE_URL}/project/{name}/")
-        time.sleep(4)
+        # pypi.org is server-rendered: the document load is all we need
+        self.open(f"{self.BASE_URL}/project/{name}/")
         title = self.driver.title
         body = self.driver.find_element(By.TAG_NAME, "body").text[:1000]
         if "page not found" in body.lower():
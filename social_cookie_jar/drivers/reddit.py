@@ -1,11 +1,11 @@
 """Reddit driver — post, comment, read feeds via www.reddit.com."""
 
-import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
-from . import BaseDriver
+from . import BaseDriver, feed_reader
 
 
 @dataclass
@@ -24,13 +24,19 @@ class RedditDriver(BaseDriver):
     PLATFORM = "reddit"
     BASE_URL = "https://www.reddit.com"
     SESSION_COOKIES = ["reddit_session", "token_v2"]
+    SESSION_REQUIRES_ALL = False
+    READY_SELECTOR = "shreddit-app, #SHORTCUT_FOCUSABLE_DIV, header"
+    FEED_SELECTOR = 'shreddit-post, [data-testid="post-container"], article'
+    LITE_BLOCKED_URLS = BaseDriver.LITE_BLOCKED_URLS + (
+        "*://i.redd.it/*", "*://preview.redd.it/*", "*://v.redd.it/*",
+        "*://styles.redditmedia.com/*",
+    )
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[reddit] No cookies found. Export them first.")
             return False
-        self.driver.get(self.BASE_URL)
-        time.sleep(5)
+        self.open(self.BASE_URL, self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         ok = any(n in cookie_names for n in self.SESSION_COOKIES)
         # Check if we see login button (not logged in)
@@ -42,35 +48,43 @@ class RedditDriver(BaseDriver):
         print(f"[reddit] {'Logged in via cookies ✓' if ok else 'Not logged in.'}")
         return ok
 
-    def feed(self, subreddit: str | None = None, limit: int = 10) -> list[RedditPost]:
-        """Read the home feed or a subreddit."""
+    @feed_reader
+    def iter_feed(self, subreddit: str | None = None, limit: int = 10) -> Iterator[RedditPost]:
+        """Stream posts from the home feed or a subreddit, scrolling as needed."""
         if subreddit:
-            self.driver.get(f"{self.BASE_URL}/r/{subreddit}/")
+            self.open(f"{self.BASE_URL}/r/{subreddit}/", self.FEED_SELECTOR)
         else:
-            self.driver.get(self.BASE_URL)
-        time.sleep(6)
-        self.driver.execute_script("window.scrollTo(0, 600);")
-        time.sleep(3)
-
-        posts_el = self.driver.find_elements(
-            By.CSS_SELECTOR,
-            'shreddit-post, [data-testid="post-container"], article',
+            self.open(self.BASE_URL, self.FEED_SELECTOR)
+        records = self.iter_items(
+            self.FEED_SELECTOR,
+            {
+                "title": ["@post-title"],
+                "url": ["@permalink", 'a[data-click-id="body"]'],
+                "subreddit": ["@subreddit-prefixed-name"],
+            },
+            limit=limit,
+            id_field="url",
         )
-        posts = []
-        for i, el in enumerate(posts_el[:limit]):
-            text = el.text[:400]
-            title = text.split("\n")[0] if text else f"Post {i}"
-            posts.append(RedditPost(index=i, title=title, text=text))
-        return posts
+        for i, r in enumerate(records):
+            yield RedditPost(
+                index=i,
+                title=r["title"] or f"Post {i}",
+                text=r["text"],
+                subreddit=r["subreddit"],
+                url=r["url"],
+            )
+
+    def feed(
+        self, subreddit: str | None = None, limit: int = 10, only_new: bool = False
+    ) -> list[RedditPost]:
+        """Read the home feed or a subreddit."""
+        return list(self.iter_feed(subreddit, limit, only_new=only_new))
 
     def post(self, subreddit: str, title: str, body: str = "") -> bool:
         """Submit a new post to a subreddit."""
-        self.driver.get(f"{self.BASE_URL}/r/{subreddit}/submit")
-        time.sleep(5)
-
         # Title field
-        title_inputs = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        title_inputs = self.open(
+            f"{self.BASE_URL}/r/{subreddit}/submit",
             'textarea[name="title"], [placeholder*="title" i], '
             'input[aria-label*="Title" i]',
         )
@@ -79,9 +93,7 @@ class RedditDriver(BaseDriver):
             return False
 
         title_inputs[0].click()
-        time.sleep(0.3)
         self.paste_text(title_inputs[0], title)
-        time.sleep(1)
 
         # Body
         if body:
@@ -92,9 +104,7 @@ class RedditDriver(BaseDriver):
             )
             if body_boxes:
                 body_boxes[0].click()
-                time.sleep(0.3)
                 self.paste_text(body_boxes[0], body)
-                time.sleep(1)
 
         # Submit
         submit = self.driver.find_elements(
@@ -104,7 +114,7 @@ class RedditDriver(BaseDriver):
             text = btn.text.strip().lower()
             if text in ("post", "submit"):
                 btn.click()
-                time.sleep(5)
+                self.wait_for_network_idle()
                 self.save_cookies()
                 print(f"[reddit] Posted: {title[:80]}")
                 return True
@@ -114,11 +124,8 @@ class RedditDriver(BaseDriver):
 
     def comment(self, post_url: str, text: str) -> bool:
         """Comment on a Reddit post by URL."""
-        self.driver.get(post_url)
-        time.sleep(5)
-
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        boxes = self.open(
+            post_url,
             '[role="textbox"][contenteditable="true"], '
             'textarea[name="comment"], .DraftEditor-root [contenteditable]',
         )
@@ -129,10 +136,7 @@ class RedditDriver(BaseDriver):
             )
             if add_btns:
                 add_btns[0].click()
-                time.sleep(2)
-            boxes = self.driver.find_elements(
-                By.CSS_SELECTOR, '[role="textbox"][contenteditable="true"]'
-            )
+            boxes = self.wait_for('[role="textbox"][contenteditable="true"]')
 
         if not boxes:
             print("[reddit] Comment box not found")
@@ -140,9 +144,7 @@ class RedditDriver(BaseDriver):
 
         box = boxes[0]
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(1)
 
         submit = self.driver.find_elements(
             By.CSS_SELECTOR, 'button[type="submit"]'
@@ -150,13 +152,13 @@ class RedditDriver(BaseDriver):
         for btn in submit:
             if "comment" in btn.text.lower():
                 btn.click()
-                time.sleep(3)
+                self.wait_for_network_idle()
                 self.save_cookies()
                 print(f"[reddit] Commented: {text[:80]}...")
                 return True
 
         # Fallback: Ctrl+Enter
         box.send_keys(Keys.CONTROL + Keys.RETURN)
-        time.sleep(3)
+        self.wait_for_network_idle()
         print(f"[reddit] Commented (Ctrl+Enter): {text[:80]}...")
         return True
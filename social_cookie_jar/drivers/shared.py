@@ -0,0 +1,131 @@
+"""One Chrome shared by several drivers, each in its own tab.
+
+    browser = SharedBrowser()
+    fb = FacebookDriver(browser=browser)
+    tw = TwitterDriver(browser=browser)
+
+The first driver to need a browser launches Chrome with its own options;
+later drivers open a tab in it, which skips a second Chrome start-up and
+its memory. Cookies are per domain, so the platforms' sessions coexist.
+
+Every WebDriver command goes through one lock and first switches to the
+tab of the driver the calling thread last used (see BaseDriver.driver),
+so drivers may be used from separate threads. They take turns, though:
+one ChromeDriver session runs one command at a time, page loads
+included. Sharing saves Chrome start-ups and memory, not wall time.
+Element objects are tied to their tab: use them on the same thread,
+before touching another driver.
+"""
+
+import contextlib
+import json
+import threading
+from typing import Callable, Optional
+
+from selenium.webdriver.remote.command import Command
+
+from ..launch import kill_tree
+
+
+class SharedBrowser:
+    """A Chrome instance whose tabs are handed out to drivers."""
+
+    def __init__(self):
+        self.driver = None
+        self._raw_execute = None
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._current: Optional[str] = None
+        self._tabs: set[str] = set()
+        self._logs: dict[str, list[dict]] = {}
+
+    def open_tab(self, create: Callable) -> str:
+        """Return a new tab's handle, launching Chrome with `create()` if needed."""
+        with self._lock:
+            if self.driver is None:
+                self.driver = create()
+                self._install()
+                handle = self._current = self.driver.current_window_handle
+            else:
+                handle = self._raw_execute(Command.NEW_WINDOW, {"type": "tab"})["value"]["handle"]
+            self._tabs.add(handle)
+            self._logs[handle] = []
+            return handle
+
+    def activate(self, handle: str):
+        """Direct the calling thread's next commands to `handle`."""
+        self._local.handle = handle
+
+    def _install(self):
+        raw = self._raw_execute = self.driver.execute
+
+        def execute(command, params=None):
+            with self._lock:
+                handle = getattr(self._local, "handle", None)
+                if handle and handle != self._current and command != Command.QUIT:
+                    raw(Command.SWITCH_TO_WINDOW, {"handle": handle})
+                    self._current = handle
+                return raw(command, params)
+
+        self.driver.execute = execute
+
+    def log_entries(self, handle: str) -> list[dict]:
+        """Performance log entries for one tab.
+
+        Chrome's log is browser-wide and reading it consumes it, so entries
+        are sorted into per-tab buffers by the target id ChromeDriver
+        records as "webview" (window handles are target ids).
+        """
+        with self._lock:
+            for entry in self.driver.get_log("performance"):
+                webview = json.loads(entry["message"]).get("webview", "")
+                for tab in self._tabs:
+                    if webview and tab.endswith(webview):
+                        self._logs[tab].append(entry)
+                        break
+            entries, self._logs[handle] = self._logs.get(handle, []), []
+            return entries
+
+    def close_tab(self, handle: str):
+        """Close a driver's tab; the last one closes Chrome."""
+        with self._lock:
+            self._tabs.discard(handle)
+            self._logs.pop(handle, None)
+            if not self._tabs:
+                self.quit()
+                return
+            self.activate(handle)
+            self.driver.close()
+            self._current = None
+            self.activate(None)
+
+    def kill(self):
+        """Kill Chrome at once, without waiting for the command lock.
+
+        A hung command holds the lock, so close_tab() and quit() would wait
+        on it; killing ChromeDriver and Chrome makes that command fail
+        instead. The drivers' own quit() calls then clean up.
+        """
+        driver = self.driver
+        try:
+            pid = driver.service.process.pid
+        except AttributeError:
+            return
+        kill_tree(pid)
+
+    def quit(self):
+        with self._lock:
+            if self.driver is not None:
+                # Fails if kill() already ended ChromeDriver
+                with contextlib.suppress(Exception):
+                    self.driver.quit()
+            self.driver = None
+            self._current = None
+            self._tabs.clear()
+            self._logs.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.quit()
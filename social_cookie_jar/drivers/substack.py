@@ -1,10 +1,10 @@
 """Substack driver — read, comment via substack.com."""
 
-import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from selenium.webdriver.common.by import By
 
-from . import BaseDriver
+from . import BaseDriver, feed_reader
 
 
 @dataclass
@@ -26,13 +26,15 @@ class SubstackDriver(BaseDriver):
     PLATFORM = "substack"
     BASE_URL = "https://substack.com"
     SESSION_COOKIES = ["substack.sid"]
+    READY_SELECTOR = "#main, main, [class*='pencraft']"
+    LOGGED_OUT_URLS = ("/sign-in",)
+    FEED_SELECTOR = "article, [class*='post-preview']"
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[substack] No cookies found. Export them first.")
             return False
-        self.driver.get(self.BASE_URL)
-        time.sleep(5)
+        self.open(self.BASE_URL, self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         ok = any("sid" in n.lower() for n in cookie_names)
         # Check if we see the dashboard or user menu
@@ -42,40 +44,40 @@ class SubstackDriver(BaseDriver):
         print(f"[substack] {'Logged in via cookies ✓' if ok else 'Not logged in.'}")
         return ok
 
-    def feed(self, limit: int = 10) -> list[SubstackPost]:
+    @feed_reader
+    def iter_feed(self, limit: int = 10) -> Iterator[SubstackPost]:
+        """Stream posts from the inbox, scrolling as needed."""
+        self.open(f"{self.BASE_URL}/inbox", self.FEED_SELECTOR)
+        records = self.iter_items(
+            self.FEED_SELECTOR,
+            {"url": ['a[href*="/p/"]', "a[href]"]},
+            limit=limit,
+            id_field="url",
+        )
+        for i, r in enumerate(records):
+            yield SubstackPost(index=i, title=r["title"] or f"Post {i}", text=r["text"], url=r["url"])
+
+    def feed(self, limit: int = 10, only_new: bool = False) -> list[SubstackPost]:
         """Read the home feed / inbox."""
-        self.driver.get(f"{self.BASE_URL}/inbox")
-        time.sleep(5)
-        articles = self.driver.find_elements(By.CSS_SELECTOR, "article, [class*='post-preview']")
-        posts = []
-        for i, art in enumerate(articles[:limit]):
-            text = art.text[:400]
-            title = text.split("\n")[0] if text else f"Post {i}"
-            posts.append(SubstackPost(index=i, title=title, text=text))
-        return posts
+        return list(self.iter_feed(limit, only_new=only_new))
 
     def comment(self, post_url: str, text: str) -> bool:
         """Comment on a Substack post."""
-        self.driver.get(post_url)
-        time.sleep(5)
+        self.open(post_url, self.READY_SELECTOR)
         # Scroll to comments
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.8);")
-        time.sleep(2)
 
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        boxes = self.wait_for(
             '[role="textbox"][contenteditable="true"], '
             'textarea[placeholder*="comment" i], '
-            '.ProseMirror[contenteditable="true"]',
+            '.ProseMirror[contenteditable="true"]'
         )
         if not boxes:
             print("[substack] Comment box not found")
             return False
         box = boxes[0]
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(1)
 
         submit = self.driver.find_elements(
             By.CSS_SELECTOR, 'button[class*="comment"]'
@@ -83,7 +85,7 @@ class SubstackDriver(BaseDriver):
         for btn in submit:
             if "post" in btn.text.lower() or "reply" in btn.text.lower():
                 btn.click()
-                time.sleep(3)
+                self.wait_for_network_idle()
                 self.save_cookies()
                 print(f"[substack] Commented: {text[:80]}...")
                 return True
@@ -1,10 +1,10 @@
 """Twitter/X driver — post, read feed, check notifications via x.com."""
 
-import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from selenium.webdriver.common.by import By
 
-from . import BaseDriver
+from . import BaseDriver, feed_reader
 
 
 @dataclass
@@ -22,37 +22,46 @@ class TwitterDriver(BaseDriver):
     PLATFORM = "twitter"
     BASE_URL = "https://x.com"
     SESSION_COOKIES = ["auth_token", "ct0"]
+    READY_SELECTOR = '[data-testid="primaryColumn"], [data-testid="loginButton"]'
+    FEED_SELECTOR = 'article[data-testid="tweet"]'
+    LITE_BLOCKED_URLS = BaseDriver.LITE_BLOCKED_URLS + (
+        "*://pbs.twimg.com/*", "*://video.twimg.com/*",
+    )
 
     def login(self) -> bool:
-        if not self.jar.inject(self.driver, self.PLATFORM, self.BASE_URL):
+        if not self.inject_cookies():
             print("[tw] No cookies found. Export them first.")
             return False
-        self.driver.get(f"{self.BASE_URL}/home")
-        time.sleep(5)
+        self.open(f"{self.BASE_URL}/home", self.READY_SELECTOR)
         cookie_names = {c["name"] for c in self.driver.get_cookies()}
         ok = all(n in cookie_names for n in self.SESSION_COOKIES)
         print(f"[tw] {'Logged in via cookies ✓' if ok else 'Cookie session expired.'}")
         return ok
 
-    def feed(self, limit: int = 10) -> list[Tweet]:
-        """Read the home timeline."""
-        self.driver.get(f"{self.BASE_URL}/home")
-        time.sleep(6)
-        articles = self.driver.find_elements(
-            By.CSS_SELECTOR, 'article[data-testid="tweet"]'
+    @feed_reader
+    def iter_feed(self, limit: int = 10) -> Iterator[Tweet]:
+        """Stream tweets from the home timeline, scrolling as needed."""
+        self.open(f"{self.BASE_URL}/home", self.FEED_SELECTOR)
+        records = self.iter_items(
+            self.FEED_SELECTOR,
+            {
+                "author": ['[data-testid="User-Name"] a[role="link"]'],
+                "url": ['a[href*="/status/"]:has(time)', 'a[href*="/status/"]'],
+            },
+            limit=limit,
+            id_field="url",
         )
-        tweets = []
-        for i, art in enumerate(articles[:limit]):
-            text = art.text[:400]
-            tweets.append(Tweet(index=i, text=text))
-        return tweets
+        for i, r in enumerate(records):
+            yield Tweet(index=i, text=r["text"], author=r["author"], url=r["url"])
+
+    def feed(self, limit: int = 10, only_new: bool = False) -> list[Tweet]:
+        """Read the home timeline."""
+        return list(self.iter_feed(limit, only_new=only_new))
 
     def post(self, text: str) -> bool:
         """Post a tweet from the home timeline composer."""
-        self.driver.get(f"{self.BASE_URL}/home")
-        time.sleep(6)
-        boxes = self.driver.find_elements(
-            By.CSS_SELECTOR,
+        boxes = self.open(
+            f"{self.BASE_URL}/home",
             '[data-testid="tweetTextarea_0"], '
             '[role="textbox"][contenteditable="true"]',
         )
@@ -62,17 +71,14 @@ class TwitterDriver(BaseDriver):
 
         box = boxes[0]
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(2)
 
-        post_btn = self.driver.find_elements(
-            By.CSS_SELECTOR,
-            '[data-testid="tweetButton"], [data-testid="tweetButtonInline"]',
+        post_btn = self.wait_for_clickable(
+            '[data-testid="tweetButton"], [data-testid="tweetButtonInline"]'
         )
         if post_btn:
-            post_btn[0].click()
-            time.sleep(4)
+            post_btn.click()
+            self.wait_for_network_idle()
             self.save_cookies()
             print(f"[tw] Posted: {text[:80]}...")
             return True
@@ -81,8 +87,11 @@ class TwitterDriver(BaseDriver):
 
     def reply(self, tweet_url: str, text: str) -> bool:
         """Reply to a specific tweet."""
-        self.driver.get(tweet_url)
-        time.sleep(5)
+        self.open(
+            tweet_url,
+            '[data-testid="tweetTextarea_0"], '
+            '[role="textbox"][contenteditable="true"]',
+        )
         boxes = self.driver.find_elements(
             By.CSS_SELECTOR, '[data-testid="tweetTextarea_0"]'
         )
@@ -96,16 +105,12 @@ class TwitterDriver(BaseDriver):
 
         box = boxes[0]
         box.click()
-        time.sleep(0.5)
         self.paste_text(box, text)
-        time.sleep(2)
 
-        btn = self.driver.find_elements(
-            By.CSS_SELECTOR, '[data-testid="tweetButton"]'
-        )
+        btn = self.wait_for_clickable('[data-testid="tweetButton"]')
         if btn:
-            btn[0].click()
-            time.sleep(4)
+            btn.click()
+            self.wait_for_network_idle()
             self.save_cookies()
             print(f"[tw] Replied: {text[:80]}...")
             return True
@@ -114,14 +119,12 @@ class TwitterDriver(BaseDriver):
 
     def notifications(self) -> str:
         """Check notifications page."""
-        self.driver.get(f"{self.BASE_URL}/notifications")
-        time.sleep(5)
+        self.open(f"{self.BASE_URL}/notifications", '[data-testid="cellInnerDiv"]')
         body = self.driver.find_element(By.TAG_NAME, "body").text[:2000]
         return body
 
     def profile(self, handle: str = "AVA1932509") -> str:
         """View a profile."""
-        self.driver.get(f"{self.BASE_URL}/{handle}")
-        time.sleep(5)
+        self.open(f"{self.BASE_URL}/{handle}", '[data-testid="UserName"]')
         body = self.driver.find_element(By.TAG_NAME, "body").text[:2000]
         return body
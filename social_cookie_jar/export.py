@@ -1,9 +1,206 @@
 """Cookie export utilities — extract cookies from various sources."""
 
 import json
-import pickle
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
+
+from .cookie_jar import CookieJar, _cookie_key
+
+
+# Each driver's BASE_URL (plus twitter.com). Kept here rather than read off
+# the driver classes so export never imports Selenium.
+PLATFORM_URLS = {
+    "facebook": ["https://www.facebook.com/"],
+    "twitter": ["https://x.com/", "https://twitter.com/"],
+    "linkedin": ["https://www.linkedin.com/"],
+    "reddit": ["https://www.reddit.com/"],
+    "discord": ["https://discord.com/"],
+    "instagram": ["https://www.instagram.com/"],
+    "hackernews": ["https://news.ycombinator.com/"],
+    "substack": ["https://substack.com/"],
+    "pypi": ["https://pypi.org/"],
+}
+
+
+def _domain_index(platforms: Optional[list[str]] = None) -> dict[str, str]:
+    """Map each platform's registrable domain (e.g. ycombinator.com) to the platform."""
+    index = {}
+    for platform, urls in PLATFORM_URLS.items():
+        if platforms is not None and platform not in platforms:
+            continue
+        for url in urls:
+            host = urlsplit(url).hostname
+            index[".".join(host.split(".")[-2:])] = platform
+    return index
+
+
+def _match_domain(cookie_domain: str, index: dict[str, str]) -> Optional[str]:
+    """Find the platform for a cookie domain by walking its suffixes."""
+    parts = cookie_domain.lstrip(".").lower().split(".")
+    for i in range(len(parts) - 1):
+        platform = index.get(".".join(parts[i:]))
+        if platform:
+            return platform
+    return None
+
+
+_SAME_SITE = {
+    "strict": "Strict",
+    "lax": "Lax",
+    "none": "None",
+    "no_restriction": "None",  # Chrome extension API
+}
+
+
+def to_selenium_cookie(c: dict) -> Optional[dict]:
+    """Convert a cookie from CDP, Playwright or a browser extension to Selenium format.
+
+    Returns None for entries without a name or value.
+    """
+    if not c.get("name") or "value" not in c:
+        return None
+    sc = {
+        "name": c["name"],
+        "value": c["value"],
+        "domain": c.get("domain", ""),
+        "path": c.get("path", "/"),
+        "secure": c.get("secure", False),
+    }
+    if c.get("httpOnly"):
+        sc["httpOnly"] = True
+    same_site = _SAME_SITE.get(str(c.get("sameSite", "")).lower())
+    if same_site:
+        sc["sameSite"] = same_site
+    # Extensions use expirationDate; CDP and Playwright use expires (-1 = session)
+    expiry = c.get("expirationDate") or c.get("expires") or c.get("expiry")
+    if expiry and expiry > 0:
+        sc["expiry"] = int(expiry)
+    return sc
+
+
+def iter_json_cookies(json_file: str, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """Yield cookie objects from a JSON array file one at a time.
+
+    Parses incrementally, so a dump covering thousands of cookies is never
+    held in memory as a whole. Files that are not a bare array (e.g.
+    `{"cookies": [...]}`) fall back to a full parse.
+    """
+    decoder = json.JSONDecoder()
+    with open(json_file, encoding="utf-8-sig") as f:
+        buf = f.read(chunk_size)
+        pos = len(buf) - len(buf.lstrip())
+        if buf[pos:pos + 1] != "[":
+            f.seek(0)
+            data = json.load(f)
+            yield from data.get("cookies", []) if isinstance(data, dict) else data
+            return
+        pos += 1
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buf):
+                buf, pos = f.read(chunk_size), 0
+                if not buf:
+                    raise ValueError(f"Unterminated JSON array in {json_file}")
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Object split across chunks: read more and retry
+                more = f.read(chunk_size)
+                if not more:
+                    raise
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield obj
+            pos = end
+
+
+def normalize_cookies(
+    raw: Iterable[dict],
+    platforms: Optional[list[str]] = None,
+    default: Optional[str] = None,
+) -> dict[str, list[dict]]:
+    """Normalise raw cookies from any source and partition them by platform.
+
+    Streams over `raw` once: each cookie is matched to a platform by domain
+    (restricted to `platforms` if given), converted to Selenium format and
+    deduplicated on (name, domain, path), the last occurrence winning.
+    Cookies matching no platform are dropped, or filed under `default`.
+    """
+    index = _domain_index(platforms)
+    jars: dict[str, dict[tuple, dict]] = {}
+    for c in raw:
+        platform = _match_domain(c.get("domain") or "", index) or default
+        if platform is None:
+            continue
+        sc = to_selenium_cookie(c)
+        if sc is not None:
+            jars.setdefault(platform, {})[_cookie_key(sc)] = sc
+    return {platform: list(jar.values()) for platform, jar in jars.items()}
+
+
+def write_cookies(
+    jars: dict[str, list[dict]], output_dir: str = "./cookies", store="pickle"
+) -> dict[str, Path]:
+    """Save normalised jars through a CookieJar backend. Returns paths by platform."""
+    jar = CookieJar(output_dir, store=store)
+    return {platform: jar.save(cookies, platform) for platform, cookies in jars.items()}
+
+
+def _export_one(
+    raw: Iterable[dict], platform: str, output_dir: str, store, keep_all: bool = False
+) -> Path:
+    """Run the pipeline for a single platform. Platforms without a known
+    domain, and callers passing `keep_all`, keep every cookie, as before."""
+    default = None if platform in PLATFORM_URLS and not keep_all else platform
+    jars = normalize_cookies(raw, [platform], default=default)
+    if not jars.get(platform):
+        raise RuntimeError(f"No cookies found for {platform}")
+    return write_cookies({platform: jars[platform]}, output_dir, store)[platform]
+
+
+def _browser_ws_url(cdp_url: str) -> str:
+    """Resolve the browser-level DevTools websocket for an endpoint."""
+    if cdp_url.startswith("ws") and "/devtools/browser/" in cdp_url:
+        return cdp_url
+    import urllib.request
+    http_url = cdp_url.replace("ws://", "http://", 1).split("/devtools/")[0].rstrip("/")
+    info = json.loads(urllib.request.urlopen(f"{http_url}/json/version").read())
+    return info["webSocketDebuggerUrl"]
+
+
+def export_all_from_cdp(
+    cdp_url: str = "http://127.0.0.1:9222",
+    output_dir: str = "./cookies",
+    platforms: Optional[list[str]] = None,
+    store: str = "pickle",
+) -> dict[str, Path]:
+    """Export every platform's cookies from one CDP session.
+
+    Makes a single Storage.getCookies call on the browser target and splits
+    the result by platform domain in one pass. Writes a jar for each
+    platform (default: all nine) that has cookies and returns their paths.
+
+    Requires `websocket-client` package.
+    """
+    import websocket
+
+    ws = websocket.create_connection(_browser_ws_url(cdp_url), suppress_origin=True)
+    try:
+        ws.send(json.dumps({"id": 1, "method": "Storage.getCookies"}))
+        result = json.loads(ws.recv())
+    finally:
+        ws.close()
+    if "error" in result:
+        raise RuntimeError(f"Storage.getCookies failed: {result['error'].get('message')}")
+
+    jars = normalize_cookies(result.get("result", {}).get("cookies", []), platforms)
+    return write_cookies(jars, output_dir, store)
 
 
 def export_from_cdp(
@@ -11,20 +208,20 @@ def export_from_cdp(
     platform: str = "facebook",
     output_dir: str = "./cookies",
     urls: Optional[list[str]] = None,
+    store: str = "pickle",
 ) -> Path:
     """Export cookies from a Chrome DevTools Protocol endpoint.
-    
+
+    By default the cookies for the platform's own URLs are fetched and only
+    those on its domains are kept. With explicit `urls` (e.g. a CDN host
+    such as fbcdn.net) every cookie Chrome returns for them is kept.
+
     Requires `websocket-client` package.
     """
     import websocket
     
     # Platform URL defaults
-    platform_urls = {
-        "facebook": ["https://www.facebook.com/"],
-        "twitter": ["https://x.com/", "https://twitter.com/"],
-        "linkedin": ["https://www.linkedin.com/"],
-    }
-    target_urls = urls or platform_urls.get(platform, [])
+    target_urls = urls or PLATFORM_URLS.get(platform, [])
 
     # Get first available page target
     import urllib.request
@@ -45,93 +242,31 @@ def export_from_cdp(
     ws.close()
 
     cookies = result.get("result", {}).get("cookies", [])
-    if not cookies:
-        raise RuntimeError(f"No cookies found for {platform}")
-
-    # Convert CDP cookies to Selenium format
-    selenium_cookies = []
-    for c in cookies:
-        sc = {
-            "name": c["name"],
-            "value": c["value"],
-            "domain": c["domain"],
-            "path": c.get("path", "/"),
-            "secure": c.get("secure", False),
-        }
-        if c.get("expires", -1) > 0:
-            sc["expiry"] = int(c["expires"])
-        selenium_cookies.append(sc)
-
-    out = Path(output_dir)
-    out.mkdir(parents=True, exist_ok=True)
-    path = out / f"{platform}.pkl"
-    with open(path, "wb") as f:
-        pickle.dump(selenium_cookies, f)
-
-    return path
+    return _export_one(cookies, platform, output_dir, store, keep_all=bool(urls))
 
 
 def export_from_json(
     json_file: str,
     platform: str = "facebook",
     output_dir: str = "./cookies",
+    store: str = "pickle",
 ) -> Path:
     """Export cookies from a JSON file (e.g., from a browser extension).
     
-    Expects a list of objects with at least: name, value, domain.
+    Expects a list of objects with at least: name, value, domain. The file
+    is parsed incrementally and, for the nine known platforms, only cookies
+    on the platform's domains are kept: cookies for other sites, including
+    its CDNs, and entries without a domain are dropped. (Earlier versions
+    kept every cookie in the file.)
     """
-    with open(json_file) as f:
-        raw_cookies = json.load(f)
-
-    selenium_cookies = []
-    for c in raw_cookies:
-        sc = {
-            "name": c["name"],
-            "value": c["value"],
-            "domain": c.get("domain", ""),
-            "path": c.get("path", "/"),
-            "secure": c.get("secure", False),
-        }
-        if "expirationDate" in c:
-            sc["expiry"] = int(c["expirationDate"])
-        elif "expires" in c and c["expires"]:
-            sc["expiry"] = int(c["expires"])
-        selenium_cookies.append(sc)
-
-    out = Path(output_dir)
-    out.mkdir(parents=True, exist_ok=True)
-    path = out / f"{platform}.pkl"
-    with open(path, "wb") as f:
-        pickle.dump(selenium_cookies, f)
-
-    return path
+    return _export_one(iter_json_cookies(json_file), platform, output_dir, store)
 
 
 def export_from_playwright(
     context,
     platform: str = "facebook",
     output_dir: str = "./cookies",
+    store: str = "pickle",
 ) -> Path:
     """Export cookies from a Playwright browser context."""
-    cookies = context.cookies()
-
-    selenium_cookies = []
-    for c in cookies:
-        sc = {
-            "name": c["name"],
-            "value": c["value"],
-            "domain": c.get("domain", ""),
-            "path": c.get("path", "/"),
-            "secure": c.get("secure", False),
-        }
-        if c.get("expires", -1) > 0:
-            sc["expiry"] = int(c["expires"])
-        selenium_cookies.append(sc)
-
-    out = Path(output_dir)
-    out.mkdir(parents=True, exist_ok=True)
-    path = out / f"{platform}.pkl"
-    with open(path, "wb") as f:
-        pickle.dump(selenium_cookies, f)
-
-    return path
+    return _export_one(context.cookies(), platform, output_dir, store)
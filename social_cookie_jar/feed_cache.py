@@ -0,0 +1,84 @@
+"""On-disk feed result cache with a TTL and LRU eviction.
+
+Each entry is one JSON file named by a hash of its key. Reads bump the
+file's mtime, so eviction removes the least recently used entries first
+once the cache grows past `max_entries` or `max_bytes`.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class FeedCache:
+    """TTL'd, size-bounded cache of feed results."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl: float = 60,
+        max_entries: int = 256,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _path(self, key) -> Path:
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key) -> Optional[dict]:
+        """Return the entry for `key` if it is younger than the TTL."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created", 0) > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, item_type: str, items: list[dict]):
+        """Store feed items for `key`, then evict down to the size bounds."""
+        entry = {"created": time.time(), "type": item_type, "items": items}
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._evict()
+
+    def _evict(self):
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        while files and (len(files) > self.max_entries or total > self.max_bytes):
+            _, size, path = files.pop(0)
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,71 @@
+"""Record of recent successful login verifications.
+
+A driver's login() loads a heavy page to confirm the session. After a
+success, the time and a fingerprint of the saved session cookies are
+written to `{cookie_dir}/state/logins.json`; within `ttl` seconds, and as long
+as the session cookies are unchanged, login() only injects cookies.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+def fingerprint(cookies: list[dict], names: list[str]) -> str:
+    """Hash of the session cookies among `cookies` ("" if there are none)."""
+    session = sorted(
+        (c["name"], c.get("domain", ""), str(c.get("value", "")))
+        for c in cookies if c.get("name") in names
+    )
+    if not session:
+        return ""
+    return hashlib.sha1(json.dumps(session).encode()).hexdigest()
+
+
+class LoginCache:
+    """Platform -> time and cookie fingerprint of its last verified login."""
+
+    def __init__(self, path: str, ttl: float = 3600):
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".logins.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get(self, platform: str, fingerprint: str) -> bool:
+        """True if `platform` was verified within the TTL with these cookies."""
+        entry = self._read().get(platform)
+        return bool(
+            fingerprint
+            and entry
+            and entry.get("fingerprint") == fingerprint
+            and time.time() - entry.get("verified", 0) <= self.ttl
+        )
+
+    def put(self, platform: str, fingerprint: str):
+        entries = self._read()
+        entries[platform] = {"verified": time.time(), "fingerprint": fingerprint}
+        self._write(entries)
+
+    def forget(self, platform: str):
+        entries = self._read()
+        if entries.pop(platform, None) is not None:
+            self._write(entries)
@@ -0,0 +1,291 @@
+"""Cumulative counters and latency histograms, persisted across runs.
+
+Updates only touch in-memory dicts. At exit (or on `flush()`) the
+accumulated deltas are merged into a JSON file under a lock, so many
+short CLI runs add up to one set of totals:
+
+    actions_total{platform, action, result}   result is ok, fail or error
+    action_seconds{platform, action}          latency histogram
+    browser_launches_total{platform}
+    selector_misses_total{platform, selector} wait_for()/wait_for_clickable() timeouts
+    cookie_writes_total{platform}
+    bytes_received_total{platform, action}    response bytes of read actions
+    browser_recycles_total{platform, kind, reason}  watchdog tab/Chrome restarts
+
+`python -m social_cookie_jar stats` prints them, with percentiles
+estimated from the histogram buckets, or in Prometheus text format.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: merges are not locked against other processes
+    fcntl = None
+
+# Histogram upper bounds in seconds: 5ms to ~2min, each 1.5x the last
+BUCKETS = tuple(round(0.005 * 1.5 ** i, 4) for i in range(26))
+
+_HELP = {
+    "actions_total": "Driver actions by result",
+    "action_seconds": "Driver action latency",
+    "browser_launches_total": "Chrome instances started",
+    "selector_misses_total": "Selectors that did not match before the wait timed out",
+    "cookie_writes_total": "Cookie jar writes",
+    "bytes_received_total": "Response bytes transferred by read actions",
+    "browser_recycles_total": "Tabs and Chrome instances recycled by the watchdog",
+}
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return (name, tuple(sorted(labels.items())))
+
+
+def _escape(value) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """Bucketed observations plus their sum and count."""
+
+    def __init__(self, counts: Optional[list[int]] = None, total: float = 0.0):
+        # One count per bound, plus the overflow (+Inf) bucket
+        self.counts = counts or [0] * (len(BUCKETS) + 1)
+        self.sum = total
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, value: float):
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+
+    def merge(self, other: "Histogram"):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile, interpolating linearly within its bucket."""
+        total = self.count
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BUCKETS[i - 1] if i > 0 else 0.0
+                upper = BUCKETS[i] if i < len(BUCKETS) else BUCKETS[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return BUCKETS[-1]
+
+
+class Metrics:
+    """Process-wide registry. Holds the deltas since the last flush."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.counters: dict[tuple, float] = {}
+        self.histograms: dict[tuple, Histogram] = {}
+        self._lock = threading.Lock()
+        self._atexit = False
+
+    def attach(self, path):
+        """Persist to `path` unless a file was already chosen; flush at exit."""
+        with self._lock:
+            if self.path is None:
+                self.path = Path(path)
+            if not self._atexit:
+                atexit.register(self.flush)
+                self._atexit = True
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self.histograms.setdefault(key, Histogram()).observe(value)
+
+    # ── Persistence ──
+
+    @staticmethod
+    def load(path) -> "Metrics":
+        """Read the totals stored at `path` (empty if there are none)."""
+        m = Metrics()
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return m
+        if data.get("buckets") != list(BUCKETS):
+            return m  # Bucket layout changed; start over
+        for c in data.get("counters", []):
+            m.counters[_key(c["name"], c["labels"])] = c["value"]
+        for h in data.get("histograms", []):
+            m.histograms[_key(h["name"], h["labels"])] = Histogram(h["counts"], h["sum"])
+        return m
+
+    def to_json(self) -> dict:
+        return {
+            "buckets": list(BUCKETS),
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ],
+            "histograms": [
+                {"name": name, "labels": dict(labels), "counts": h.counts, "sum": h.sum}
+                for (name, labels), h in sorted(self.histograms.items(), key=lambda kv: kv[0])
+            ],
+        }
+
+    def flush(self):
+        """Merge the pending deltas into the metrics file and reset them."""
+        with self._lock:
+            if self.path is None or not (self.counters or self.histograms):
+                return
+            counters, histograms = self.counters, self.histograms
+            self.counters, self.histograms = {}, {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "w") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            totals = Metrics.load(self.path)
+            for key, value in counters.items():
+                totals.counters[key] = totals.counters.get(key, 0) + value
+            for key, h in histograms.items():
+                totals.histograms.setdefault(key, Histogram()).merge(h)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".metrics.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(totals.to_json(), f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+    # ── Reporting ──
+
+    def prometheus(self, prefix: str = "social_cookie_jar_") -> str:
+        """Render in the Prometheus text exposition format."""
+        def fmt(labels, extra=()):
+            pairs = [*labels, *extra]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+        lines = []
+        for name in sorted({n for n, _ in self.counters}):
+            lines.append(f"# HELP {prefix}{name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {prefix}{name} counter")
+            for (n, labels), value in sorted(self.counters.items()):
+                if n == name:
+                    lines.append(f"{prefix}{name}{fmt(labels)} {value:g}")
+        for name in sorted({n for n, _ in self.histograms}):
+            lines.append(f"# HELP {prefix}{name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {prefix}{name} histogram")
+            for (n, labels), h in sorted(self.histograms.items(), key=lambda kv: kv[0]):
+                if n != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip([*BUCKETS, "+Inf"], h.counts):
+                    cumulative += count
+                    lines.append(f"{prefix}{name}_bucket{fmt(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{prefix}{name}_sum{fmt(labels)} {h.sum:g}")
+                lines.append(f"{prefix}{name}_count{fmt(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """Human-readable table: per-action success and latency, then counters."""
+        results: dict[tuple, dict[str, float]] = {}
+        for (name, labels), value in self.counters.items():
+            if name == "actions_total":
+                d = dict(labels)
+                results.setdefault((d["platform"], d["action"]), {})[d["result"]] = value
+        lines = [
+            f"{'platform':<12} {'action':<16} {'calls':>6} {'ok':>6} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8}"
+        ]
+        for (name, labels), h in sorted(self.histograms.items(), key=lambda kv: kv[0]):
+            if name != "action_seconds":
+                continue
+            d = dict(labels)
+            res = results.get((d["platform"], d["action"]), {})
+            calls = sum(res.values()) or h.count
+            ok = f"{res.get('ok', 0) / calls * 100:.0f}%" if calls else "-"
+            lines.append(
+                f"{d['platform']:<12} {d['action']:<16} {calls:>6g} {ok:>6} "
+                + " ".join(f"{h.quantile(q) * 1000:>6.0f}ms" for q in (0.5, 0.95, 0.99))
+            )
+        other = [
+            (name, labels, value) for (name, labels), value in sorted(self.counters.items())
+            if name != "actions_total"
+        ]
+        if other:
+            lines.append("")
+            for name, labels, value in other:
+                label_str = ", ".join(f"{k}={v}" for k, v in labels)
+                lines.append(f"{name:<24} {value:>6g}  {label_str}")
+        return "\n".join(lines)
+
+
+REGISTRY = Metrics()
+
+
+def timed(platform: str, action: str):
+    """Count and time each call of a driver action (whole iteration for generators).
+
+    A falsy return value counts as "fail" and an exception as "error".
+    """
+    def decorate(fn):
+        def record(start, result):
+            REGISTRY.observe(
+                "action_seconds", time.perf_counter() - start, platform=platform, action=action
+            )
+            REGISTRY.inc("actions_total", platform=platform, action=action, result=result)
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def gen_wrapper(*args, **kwargs):
+                start, result = time.perf_counter(), "error"
+                try:
+                    value = yield from fn(*args, **kwargs)
+                    result = "ok"
+                    return value
+                except GeneratorExit:
+                    result = "ok"  # The caller stopped early
+                    raise
+                finally:
+                    record(start, result)
+            return gen_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start, result = time.perf_counter(), "error"
+            try:
+                value = fn(*args, **kwargs)
+                result = "ok" if value else "fail"
+                return value
+            finally:
+                record(start, result)
+        return wrapper
+
+    return decorate
@@ -0,0 +1,105 @@
+"""Read several platforms' feeds concurrently into one tagged stream.
+
+Each platform gets its own worker thread and driver session (login, then
+iter_feed). Items are yielded as `(platform, item)` in the order they
+arrive, so total wall time tracks the slowest platform instead of the
+sum. A platform that is still running after `timeout` seconds is dropped
+from the stream and its browser is shut down.
+
+With a SharedBrowser in `driver_kwargs` the platforms share one Chrome
+and take turns in it, so the wall time is the sum again; a timeout then
+kills that Chrome.
+"""
+
+import contextlib
+import queue
+import threading
+import time
+from collections.abc import Iterator
+
+from .registry import DRIVERS
+
+_DONE = object()
+
+
+class _Failed:
+    def __init__(self, reason: str):
+        self.reason = reason
+
+
+def feed_platforms() -> list[str]:
+    """Platforms whose driver has an iter_feed() (imports the driver classes)."""
+    return [p for p in DRIVERS if hasattr(DRIVERS[p], "iter_feed")]
+
+
+def iter_feeds(
+    platforms: list[str],
+    limit: int = 10,
+    timeout: float = 60.0,
+    only_new: bool = False,
+    **driver_kwargs,
+) -> Iterator[tuple[str, object]]:
+    """Yield `(platform, item)` from every platform's feed as items arrive.
+
+    Platforms that fail to log in, raise, or exceed `timeout` are reported
+    as `[platform] ...` lines and skipped; the rest keep streaming.
+    `driver_kwargs` go to every driver constructor.
+    """
+    results: queue.Queue = queue.Queue()
+    cancel = threading.Event()
+    drivers = {}
+
+    def worker(platform: str):
+        driver = None
+        try:
+            driver = drivers[platform] = DRIVERS[platform](**driver_kwargs)
+            if not driver.has_fresh_feed(limit=limit) and not driver.login():
+                results.put((platform, _Failed("not logged in")))
+                return
+            for item in driver.iter_feed(limit=limit, only_new=only_new):
+                if cancel.is_set():
+                    break
+                results.put((platform, item))
+        except Exception as e:
+            results.put((platform, _Failed(f"{type(e).__name__}: {e}")))
+        finally:
+            results.put((platform, _DONE))
+            if driver is not None:
+                with contextlib.suppress(Exception):
+                    driver.quit()
+
+    deadline = time.monotonic() + timeout
+    pending = set(platforms)
+    for platform in platforms:
+        threading.Thread(
+            target=worker, args=(platform,), name=f"scj-feed-{platform}", daemon=True
+        ).start()
+
+    try:
+        while pending:
+            try:
+                platform, item = results.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                for platform in sorted(pending):
+                    print(f"[{platform}] Timed out after {timeout:g}s")
+                break
+            if item is _DONE:
+                pending.discard(platform)
+            elif isinstance(item, _Failed):
+                print(f"[{platform}] Feed failed: {item.reason}")
+            else:
+                yield platform, item
+    finally:
+        cancel.set()
+        # Workers that are still busy are stuck in a WebDriver call;
+        # quitting the browser makes that call fail so the thread can end
+        for platform in pending:
+            driver = drivers.get(platform)
+            if driver is None:
+                continue
+            if driver.browser is not None:
+                # A tab's quit() would wait for the lock the stuck call holds
+                driver.browser.kill()
+                continue
+            with contextlib.suppress(Exception):
+                driver.quit()
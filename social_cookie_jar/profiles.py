@@ -0,0 +1,69 @@
+"""Persistent per-platform Chrome profiles (user-data-dir).
+
+A profile keeps Chrome's HTTP cache, code cache and service workers
+between runs, so the heavy SPAs load from disk instead of re-downloading
+their bundles, and it keeps the session cookies Chrome itself saved.
+
+Profiles live at `{profile_dir}/{platform}`. Caches are trimmed to a size
+cap before Chrome starts (and by `profiles clean`); cookies, local
+storage and IndexedDB are never touched.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+# Disposable directories, dropped in this order until a profile fits its cap
+CACHE_DIRS = (
+    "Default/Service Worker/CacheStorage",
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache",
+)
+
+DEFAULT_MAX_MB = 512
+
+
+def profile_path(profile_dir, platform: str) -> Path:
+    return Path(profile_dir) / platform
+
+
+def dir_size(path: Path) -> int:
+    """Total size in bytes of the files under `path`."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def trim_profile(path: Path, max_bytes: int) -> int:
+    """Drop cache directories until the profile is under `max_bytes`.
+
+    Returns the number of bytes freed.
+    """
+    size = dir_size(path)
+    freed = 0
+    for rel in CACHE_DIRS:
+        if size - freed <= max_bytes:
+            break
+        cache = path / rel
+        if cache.is_dir():
+            n = dir_size(cache)
+            shutil.rmtree(cache, ignore_errors=True)
+            freed += n
+    return freed
+
+
+def list_profiles(profile_dir) -> dict[str, int]:
+    """Size in bytes of each platform profile under `profile_dir`."""
+    root = Path(profile_dir)
+    if not root.is_dir():
+        return {}
+    return {p.name: dir_size(p) for p in sorted(root.iterdir()) if p.is_dir()}
@@ -0,0 +1,50 @@
+"""Lazy platform → driver class registry.
+
+Driver modules pull in Selenium, so nothing is imported until a driver
+class is actually looked up.
+"""
+
+import importlib
+from collections.abc import Mapping
+
+
+class DriverRegistry(Mapping):
+    """Read-only mapping of platform name to driver class, imported on first access."""
+
+    def __init__(self, paths: dict[str, str]):
+        self._paths = paths
+        self._loaded: dict[str, type] = {}
+
+    def __getitem__(self, platform: str) -> type:
+        if platform not in self._loaded:
+            module, _, name = self._paths[platform].partition(":")
+            self._loaded[platform] = getattr(
+                importlib.import_module(module, __package__), name
+            )
+        return self._loaded[platform]
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, platform) -> bool:
+        return platform in self._paths
+
+    def class_names(self) -> dict[str, str]:
+        """Map driver class name to platform without importing anything."""
+        return {path.partition(":")[2]: p for p, path in self._paths.items()}
+
+
+DRIVERS = DriverRegistry({
+    "facebook": ".drivers.facebook:FacebookDriver",
+    "twitter": ".drivers.twitter:TwitterDriver",
+    "linkedin": ".drivers.linkedin:LinkedInDriver",
+    "reddit": ".drivers.reddit:RedditDriver",
+    "discord": ".drivers.discord:DiscordDriver",
+    "instagram": ".drivers.instagram:InstagramDriver",
+    "hackernews": ".drivers.hackernews:HackerNewsDriver",
+    "substack": ".drivers.substack:SubstackDriver",
+    "pypi": ".drivers.pypi:PyPIDriver",
+})
@@ -0,0 +1,114 @@
+"""Persistent "seen items" index, so feed polls can return only new items.
+
+Items are recorded per (platform, feed) as 64-bit hashes of their stable
+id in one SQLite file. Entries older than `max_age` are dropped, and each
+feed keeps at most `max_items` of its most recent entries. Channel-style
+readers keep a cursor (the last message id) instead.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    platform   TEXT NOT NULL,
+    feed       TEXT NOT NULL,
+    item       INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    PRIMARY KEY (platform, feed, item)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS seen_age ON seen (platform, feed, first_seen);
+CREATE TABLE IF NOT EXISTS cursors (
+    platform TEXT NOT NULL,
+    feed     TEXT NOT NULL,
+    cursor   TEXT NOT NULL,
+    PRIMARY KEY (platform, feed)
+);
+"""
+
+
+def _item_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+class SeenIndex:
+    """Bounded, age-limited record of feed items already returned."""
+
+    def __init__(
+        self,
+        path: str,
+        max_items: int = 5000,
+        max_age: float = 30 * 86400,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_items = max_items
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def filter_new(self, platform: str, feed: str, keys: list[str]) -> list[bool]:
+        """Record `keys` as seen; return, per key, whether it was new."""
+        now = time.time()
+        result = []
+        with self._lock, self._conn:
+            for key in keys:
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?)",
+                    (platform, feed, _item_hash(key), now),
+                )
+                result.append(cur.rowcount == 1)
+        return result
+
+    def is_new(self, platform: str, feed: str, key: str) -> bool:
+        """Record one key as seen; return whether it was new."""
+        return self.filter_new(platform, feed, [key])[0]
+
+    def evict(self, platform: str, feed: str):
+        """Apply the age and size bounds to one feed."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM seen WHERE platform = ? AND feed = ? AND first_seen < ?",
+                (platform, feed, time.time() - self.max_age),
+            )
+            self._conn.execute(
+                "DELETE FROM seen WHERE platform = ? AND feed = ? AND item NOT IN ("
+                " SELECT item FROM seen WHERE platform = ? AND feed = ?"
+                " ORDER BY first_seen DESC LIMIT ?)",
+                (platform, feed, platform, feed, self.max_items),
+            )
+
+    def get_cursor(self, platform: str, feed: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cursor FROM cursors WHERE platform = ? AND feed = ?", (platform, feed)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_cursor(self, platform: str, feed: str, cursor: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)", (platform, feed, cursor)
+            )
+
+    def forget(self, platform: str, feed: Optional[str] = None):
+        """Drop seen items and cursors for a platform, or one of its feeds."""
+        where, params = "platform = ?", [platform]
+        if feed is not None:
+            where += " AND feed = ?"
+            params.append(feed)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM seen WHERE {where}", params)
+            self._conn.execute(f"DELETE FROM cursors WHERE {where}", params)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,242 @@
+"""Cookie storage backends for CookieJar.
+
+A store persists Selenium-format cookie lists per platform. CookieJar
+caches what it reads, so every store exposes a cheap `stamp()` that
+changes whenever a platform's cookies do, and a `close()` that releases
+whatever it holds open.
+
+    PickleStore  one {platform}.pkl / .json file per platform (default)
+    SQLiteStore  a single cookies.db indexed by platform, domain and expiry
+"""
+
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class PickleStore:
+    """One `{platform}.pkl` or `.json` file per platform."""
+
+    name = "pickle"
+
+    def __init__(self, cookie_dir: Path):
+        self.cookie_dir = Path(cookie_dir)
+
+    def locate(self, platform: str) -> Optional[Path]:
+        """Return the file holding a platform's cookies. Tries pkl first, then json."""
+        for fmt in ("pkl", "json"):
+            path = self.cookie_dir / f"{platform}.{fmt}"
+            if path.exists():
+                return path
+        return None
+
+    def stamp(self, source: Path, platform: str) -> Optional[tuple]:
+        try:
+            st = source.stat()
+        except OSError:
+            return None
+        # Writes rename a new file into place, so the inode changes too
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def read(self, source: Path, platform: str) -> list[dict]:
+        if source.suffix == ".pkl":
+            with open(source, "rb") as f:
+                return pickle.load(f) or []
+        with open(source) as f:
+            return json.load(f) or []
+
+    def write(self, platform: str, cookies: list[dict], fmt: str = "pkl") -> Path:
+        """Write through a temp file and rename, so readers never see a partial jar."""
+        if fmt == "pkl":
+            data = pickle.dumps(cookies)
+        elif fmt == "json":
+            data = json.dumps(cookies, indent=2).encode()
+        else:
+            raise ValueError(f"Unknown format: {fmt}")
+        path = self.cookie_dir / f"{platform}.{fmt}"
+        fd, tmp = tempfile.mkstemp(dir=self.cookie_dir, prefix=f".{platform}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return path
+
+    def platforms(self) -> list[str]:
+        names = {p.stem for p in self.cookie_dir.glob("*.pkl")}
+        names |= {p.stem for p in self.cookie_dir.glob("*.json")}
+        return sorted(names)
+
+    def expiring(self, before: float, names: Optional[list[str]] = None) -> dict[str, int]:
+        """Earliest expiry before `before` per platform (full scan of every jar)."""
+        result = {}
+        for platform in self.platforms():
+            source = self.locate(platform)
+            if source is None:
+                continue
+            expiries = [
+                c["expiry"] for c in self.read(source, platform)
+                if c.get("expiry") and c["expiry"] < before
+                and (names is None or c.get("name") in names)
+            ]
+            if expiries:
+                result[platform] = min(expiries)
+        return result
+
+    def close(self):
+        pass  # Nothing held open between calls
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jars (
+    platform   TEXT PRIMARY KEY,
+    updated_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cookies (
+    platform  TEXT NOT NULL,
+    name      TEXT NOT NULL,
+    domain    TEXT NOT NULL DEFAULT '',
+    path      TEXT NOT NULL DEFAULT '/',
+    value     TEXT NOT NULL,
+    secure    INTEGER NOT NULL DEFAULT 0,
+    http_only INTEGER NOT NULL DEFAULT 0,
+    same_site TEXT,
+    expiry    INTEGER,
+    extra     TEXT,
+    PRIMARY KEY (platform, name, domain, path)
+);
+CREATE INDEX IF NOT EXISTS cookies_domain ON cookies (domain);
+CREATE INDEX IF NOT EXISTS cookies_expiry ON cookies (expiry, platform);
+"""
+
+# Selenium cookie keys with their own column; anything else goes to `extra`
+_COLUMNS = {"name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expiry"}
+
+
+class SQLiteStore:
+    """All platforms in one `cookies.db`, indexed by platform, domain and expiry.
+
+    Each save replaces a platform's cookies in a single transaction, so
+    readers see either the old jar or the new one. The database is opened
+    on first use and again after close().
+    """
+
+    name = "sqlite"
+
+    def __init__(self, cookie_dir: Path, filename: str = "cookies.db"):
+        self.path = Path(cookie_dir) / filename
+        self._lock = threading.Lock()
+        self._db = None
+
+    @property
+    def _conn(self):
+        """The open connection; callers hold self._lock."""
+        if self._db is None:
+            import sqlite3  # Only the sqlite store needs it; keeps CLI start-up light
+
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+        return self._db
+
+    def locate(self, platform: str) -> Optional[Path]:
+        return self.path if self.stamp(self.path, platform) else None
+
+    def stamp(self, source: Path, platform: str) -> Optional[tuple]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_ns FROM jars WHERE platform = ?", (platform,)
+            ).fetchone()
+        return row
+
+    def read(self, source: Path, platform: str) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, value, domain, path, secure, http_only, same_site, expiry, extra "
+                "FROM cookies WHERE platform = ? ORDER BY rowid",
+                (platform,),
+            ).fetchall()
+        cookies = []
+        for name, value, domain, path, secure, http_only, same_site, expiry, extra in rows:
+            c = {
+                "name": name,
+                "value": value,
+                "domain": domain,
+                "path": path,
+                "secure": bool(secure),
+                "httpOnly": bool(http_only),
+            }
+            if same_site:
+                c["sameSite"] = same_site
+            if expiry is not None:
+                c["expiry"] = expiry
+            if extra:
+                c.update(json.loads(extra))
+            cookies.append(c)
+        return cookies
+
+    def write(self, platform: str, cookies: list[dict], fmt: str = "pkl") -> Path:
+        rows = []
+        for c in cookies:
+            extra = {k: v for k, v in c.items() if k not in _COLUMNS}
+            rows.append((
+                platform,
+                c["name"],
+                c.get("domain", ""),
+                c.get("path", "/"),
+                c["value"],
+                int(bool(c.get("secure", False))),
+                int(bool(c.get("httpOnly", False))),
+                c.get("sameSite"),
+                int(c["expiry"]) if c.get("expiry") else None,
+                json.dumps(extra) if extra else None,
+            ))
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cookies WHERE platform = ?", (platform,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cookies VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jars (platform, updated_ns) VALUES (?, ?)",
+                (platform, time.time_ns()),
+            )
+        return self.path
+
+    def platforms(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT platform FROM jars ORDER BY platform").fetchall()
+        return [r[0] for r in rows]
+
+    def expiring(self, before: float, names: Optional[list[str]] = None) -> dict[str, int]:
+        """Earliest expiry before `before` per platform, in one indexed query."""
+        if names is not None and not names:
+            return {}
+        sql = "SELECT platform, MIN(expiry) FROM cookies WHERE expiry < ?"
+        params: list = [int(before)]
+        if names is not None:
+            sql += f" AND name IN ({', '.join('?' * len(names))})"
+            params += list(names)
+        sql += " GROUP BY platform"
+        with self._lock:
+            return dict(self._conn.execute(sql, params).fetchall())
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+STORES = {
+    PickleStore.name: PickleStore,
+    SQLiteStore.name: SQLiteStore,
+}
@@ -0,0 +1,152 @@
+"""Span tracing of driver operations, exported as Chrome trace-event JSON.
+
+Off by default. Turn it on with the SOCIAL_COOKIE_JAR_TRACE=FILE
+environment variable, the CLI's `--trace FILE`, or `enable(FILE)`; the
+trace is written when the process exits (or on `dump()`) and opens in
+chrome://tracing or https://ui.perfetto.dev.
+
+While disabled, `span()` returns a shared no-op context manager and
+`traced` wrappers make one global check, so instrumentation stays in
+place at no measurable cost.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+ENV_VAR = "SOCIAL_COOKIE_JAR_TRACE"
+
+_NULL = nullcontext()
+
+
+class Tracer:
+    """Collects complete ("X") trace events, one lane per thread."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.events: list[dict] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, **args):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (time.perf_counter_ns() - start) / 1000,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            with self._lock:
+                self.events.append(event)
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """Write the collected events as trace-event JSON. Returns the path."""
+        path = path or self.path
+        if not path:
+            return None
+        with self._lock:
+            events = list(self.events)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable(path: Optional[str] = None) -> Tracer:
+    """Start recording spans; with `path`, write them there at exit."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path)
+        atexit.register(dump)
+    elif path:
+        _tracer.path = path
+    return _tracer
+
+
+def disable():
+    global _tracer
+    _tracer = None
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def dump(path: Optional[str] = None) -> Optional[str]:
+    """Write the current trace, if tracing is on. Returns the path written."""
+    return _tracer.dump(path) if _tracer is not None else None
+
+
+def span(name: str, **args):
+    """Context manager timing one operation; a shared no-op when disabled."""
+    if _tracer is None:
+        return _NULL
+    return _tracer.span(name, **args)
+
+
+def traced(name: str, *arg_names: str):
+    """Decorate a function (or generator function) so each call is a span.
+
+    The values of the parameters listed in `arg_names` are recorded as span
+    args. For generators the span covers the whole iteration, so streamed
+    feeds show the time spent producing every item.
+    """
+    def decorate(fn):
+        sig = inspect.signature(fn) if arg_names else None
+
+        def start(args, kwargs):
+            if sig is None:
+                return _tracer.span(name)
+            bound = sig.bind_partial(*args, **kwargs).arguments
+            return _tracer.span(name, **{k: bound[k] for k in arg_names if k in bound})
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def gen_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return (yield from fn(*args, **kwargs))
+                with start(args, kwargs):
+                    return (yield from fn(*args, **kwargs))
+            return gen_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with start(args, kwargs):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def instrument_webdriver(driver):
+    """Record every WebDriver command (navigation, script, element query) as a span."""
+    execute = driver.execute
+
+    def traced_execute(command, params=None):
+        with span(f"webdriver.{command}"):
+            return execute(command, params)
+
+    driver.execute = traced_execute
+    return driver
+
+
+if os.environ.get(ENV_VAR):
+    enable(os.environ[ENV_VAR])
@@ -0,0 +1,36 @@
+import time
+
+from social_cookie_jar.cookie_jar import CookieJar
+from social_cookie_jar.drivers.hackernews import HackerNewsDriver
+from social_cookie_jar.login_cache import LoginCache
+from social_cookie_jar.metrics import REGISTRY
+
+
+def test_expiring_ignores_metrics_file(tmp_path, monkeypatch):
+    jar = CookieJar(tmp_path)
+    expiry = int(time.time()) + 3600
+    jar.save([{"name": "user", "value": "x", "expiry": expiry}], "hackernews")
+
+    # A driver run writes its metrics next to the cookies
+    monkeypatch.setattr(REGISTRY, "path", None)
+    HackerNewsDriver(cookie_dir=str(tmp_path))
+    REGISTRY.inc("cookie_writes_total", platform="hackernews")
+    REGISTRY.flush()
+    assert (tmp_path / "state" / "metrics.json").exists()
+
+    jar = CookieJar(tmp_path)
+    assert jar.platforms() == ["hackernews"]
+    assert jar.expiring(within=86400) == {"hackernews": expiry}
+
+
+def test_login_cache_is_not_a_platform(tmp_path):
+    jar = CookieJar(tmp_path)
+    jar.save([{"name": "user", "value": "x"}], "hackernews")
+    driver = HackerNewsDriver(cookie_dir=str(tmp_path), login_cache_ttl=60)
+    driver.login_cache.put("hackernews", "fingerprint")
+
+    assert driver.login_cache.path == tmp_path / "state" / "logins.json"
+    assert LoginCache(driver.login_cache.path).get("hackernews", "fingerprint")
+    jar = CookieJar(tmp_path)
+    assert jar.platforms() == ["hackernews"]
+    assert jar.load("logins") is None